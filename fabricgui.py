@@ -9,236 +9,242 @@ Windows fixes:
 - Capture server stdout so failures show the real reason in logs/UI.
 """
 
+import asyncio
+import atexit
 import codecs
+import concurrent.futures
+import collections
+import functools
+import io
 import json
 import logging
 import logging.handlers
 import os
+import queue
 import re
 import shutil
+import socket
 import subprocess
+import sys
 import threading
 import time
 import tkinter as tk
 from datetime import datetime
 from pathlib import Path
-from tkinter import ttk, messagebox, filedialog
-from typing import Dict, List, Optional, Any
+from tkinter import ttk, messagebox
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, List, Mapping, Optional, Any, Callable, Sequence
 from urllib.parse import urlparse
 
 import customtkinter as ctk
-import requests
+
+# Optional: orjson parses and serializes the history log noticeably faster and works on bytes directly
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _json_dumps_bytes = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps_bytes(obj: Any) -> bytes:
+        # Same compact UTF-8 output orjson produces
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+if TYPE_CHECKING:
+    # Imported lazily at runtime; see ServerManager._get_session()
+    import requests
 
 # -----------------------------
 # Constants
 # -----------------------------
 
 MAX_HISTORY_SIZE = 50
-CHUNK_SIZE = 4096
+HISTORY_SAVE_DELAY = 0.5  # seconds; coalesces bursts of history writes
 SERVER_HEALTH_CHECK_INTERVAL = 5  # seconds
+HEALTH_CHECK_MIN_INTERVAL = 0.25  # seconds; first poll after a state change
+HEALTH_WATCHDOG_MS = 10000  # re-arms health polling if a probe's result never makes it back to the Tk thread
+HEALTH_FAST_POLL_WINDOW = 5  # seconds of fast polling after start_server()
+STATUS_LOG_MIN_INTERVAL = 1.0  # seconds between logged online/offline transitions
+SERVER_START_WAIT = 5.0  # seconds to wait for a freshly launched server before health polling takes over
+SERVER_OUTPUT_TAIL = 50  # server output lines kept for error reporting
+SERVER_START_PROBE_MS = 50  # first delay between readiness probes after launching the server
+SERVER_START_PROBE_MAX_MS = 400  # probe delay doubles up to this cap
+SERVER_PORT_PROBE_TIMEOUT = 0.05  # seconds for the TCP connect that precedes each HTTP probe
+SERVER_STOP_TIMEOUT = 1.5  # seconds to wait after terminate() before kill()
 LOG_MAX_BYTES = 5 * 1024 * 1024
 LOG_BACKUP_COUNT = 3
+MODELS_CACHE_TTL = 60  # seconds
+MODELS_LIST_TIMEOUT = 30  # seconds before a hung `fabric --listmodels` is killed
+PATTERNS_CACHE_TTL = 30  # seconds
+NET_WORKERS = 2  # background HTTP workers; also the keep-alive pool size so no worker opens a throwaway connection
+LOG_BUFFER_SIZE = 64 * 1024
+LOG_FLUSH_INTERVAL = 5  # seconds
+
+# `fabric --listmodels` lines look like "[12]  Provider|model-name"
+# Scanned over the raw output in one pass; the capture excludes surrounding
+# blanks (and a CRLF's \r), and only the captured model text is decoded
+_MODEL_LINE_RE = re.compile(rb"^[ \t]*\[\d+\][ \t]*(.*?)[ \t\r]*$", re.MULTILINE)
+_DEFAULT_MODEL_RE = re.compile(r"^DEFAULT_MODEL=(.+)$", re.MULTILINE)
+_URL_WS_RE = re.compile(r"\s")
+# Noise fabric prints when no local Ollama is running; `.` never crosses a newline
+_FILTER_RE = re.compile(r"Ollama Get.*connectex|connectex.*Ollama Get")
+# Same match widened to the whole line plus its newline, so one sub() drops every noisy line
+_FILTER_LINE_RE = re.compile(r"^.*(?:Ollama Get.*connectex|connectex.*Ollama Get).*(?:\n|$)", re.MULTILINE)
 
 FONT_HEADING = ("Roboto", 14, "bold")
 FONT_CODE = ("Consolas", 12)
 DEFAULT_WINDOW_SIZE = "900x600"
+UI_DEBOUNCE_MS = 120  # delay before reacting to bursts of Tk variable writes
+OUTPUT_READ_SIZE = 64 * 1024  # bytes per read from fabric's stdout (requests and --serve)
+SAVE_WRITE_CHUNK_CHARS = 64 * 1024  # characters per write when saving output to a file
+CONFIG_SAVE_DELAY_MS = 500  # idle time before UI-triggered config changes hit disk
+OUTPUT_DRAIN_MS = 33  # coalescing window (~30 Hz) for streamed output before it hits the Text widget
+TOOLTIP_DELAY_MS = 400  # hover dwell before a tooltip appears
+HISTORY_NAV_DEBOUNCE_MS = 30  # coalesces key-repeat while Alt+Left/Right is held
+SHUTDOWN_DEADLINE_MS = 8000  # hard limit on background cleanup before the window is destroyed
+SHUTDOWN_REQUEST_TIMEOUT = 5.0  # seconds to wait for a cancelled request to reap its fabric process
 
 # -----------------------------
 # Help Documentation
 # -----------------------------
 
-HELP_TEXT = """
-╔══════════════════════════════════════════════════════════════════╗
-║                     FABRIC GUI - USER GUIDE                      ║
-╚══════════════════════════════════════════════════════════════════╝
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-  WHAT IS FABRIC GUI?
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-Fabric GUI is a desktop client for the Fabric AI framework. It provides
-a graphical interface to run AI "patterns" - pre-built prompts that
-transform your input text using AI models like GPT-4, Claude, etc.
-
-Common use cases:
-  • Summarizing articles, transcripts, or documents
-  • Extracting key insights from meetings
-  • Analyzing and improving writing
-  • Generating code explanations
-  • And many more patterns...
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-  GETTING STARTED
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-1. START THE SERVER
-   Click the "Start" button to launch the Fabric server.
-   The LED indicator will turn green when ready.
-
-2. SELECT A PATTERN
-   Use the Pattern dropdown to choose what you want to do.
-   Use the search box to filter patterns by name.
-
-3. ENTER YOUR INPUT
-   Paste or type text into the Input panel.
-   Use "Import" to load text from a .txt or .md file.
-
-4. CLICK SEND
-   The output will appear in the Output panel.
-   A pulsing animation shows processing is active.
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-  SERVER MANAGEMENT
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-STATUS LED:
-  🔴 Red   = Server offline
-  🟢 Green = Server online and ready
-
-BUTTONS:
-  [Start] - Launch the Fabric server
-  [Stop]  - Shut down the server
-  [Test]  - Check server connectivity
-
-BASE URL:
-  Default: http://localhost:8083
-  The server runs on port 8083 to avoid common conflicts.
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-  INPUT/OUTPUT PANELS
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+HELP_FILE = Path(getattr(sys, "_MEIPASS", Path(__file__).resolve().parent)) / "help_text.txt"
 
-INPUT TOOLBAR:
-  [Import] - Load text from a file (.txt, .md)
-  [Paste]  - Paste from clipboard
-  [Clear]  - Clear the input box
 
-OUTPUT TOOLBAR:
-  [Copy]   - Copy output to clipboard
-  [Save]   - Save output to a file
-  [Clear]  - Clear the output box
-  [<] [>]  - Navigate through history
+@functools.lru_cache(maxsize=1)
+def _read_help_file() -> str:
+    # Only successful reads are cached; a failure raises and is retried next time
+    return HELP_FILE.read_text(encoding="utf-8")
 
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-  KEYBOARD SHORTCUTS
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-  Ctrl+Enter    Send request
-  Ctrl+S        Save output to file
-  Ctrl+C        Copy output to clipboard
-  Alt+Left      Previous history entry
-  Alt+Right     Next history entry
+def get_help_text() -> str:
+    """Read the user guide on first use instead of holding it in memory from import."""
+    try:
+        return _read_help_file()
+    except OSError as e:
+        logger.error(f"Failed to read help text: {e}")
+        return f"User guide not found: {HELP_FILE}"
 
-  Right-click any text box for Cut/Copy/Paste/Select All
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-  HISTORY
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-Fabric GUI saves your last 50 requests automatically.
-
-Use the [<] and [>] buttons or Alt+Arrow keys to navigate.
-History includes the pattern used, input text, and output.
-History persists between sessions.
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-  MODEL SELECTION
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-The Model dropdown shows all available AI models grouped by provider.
-Click "Default: ..." to reset to your configured default model.
-
-Models are loaded from Fabric's configuration.
-You can set your default model using: fabric --setup
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-  CONFIGURATION
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-Settings are saved automatically to:
-  ~/.fabric_gui/config.json
-
-You can manually edit this file to change:
-  • auto_start_server: true/false
-  • stop_server_on_exit: true/false
-  • server_health_check_interval: seconds
-  • fabric_command: path to Fabric executable
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-  LOGS
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-Logs are saved to: ~/.fabric_gui/fabric_gui.log
+# -----------------------------
+# Logging
+# -----------------------------
 
-Log files rotate automatically:
-  • Max size: 5 MB per file
-  • Keeps 3 backup files
-  • Total max: ~20 MB
+LOG_DIR = Path.home() / ".fabric_gui"
+LOG_DIR.mkdir(exist_ok=True)
+LOG_FILE = LOG_DIR / "fabric_gui.log"
+_LOG_FILE_STR = str(LOG_FILE)
 
-View logs: Help → View Logs
+# Fabric's own settings (DEFAULT_MODEL, provider keys)
+FABRIC_ENV_FILE = Path.home() / ".config" / "fabric" / ".env"
 
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-  TROUBLESHOOTING
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-"Server won't start"
-  → Make sure Fabric is installed (fabric --version)
-  → Check if port 8083 is available
-  → View logs for detailed error messages
+class BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """RotatingFileHandler with a large write buffer.
 
-"No patterns showing"
-  → Start the server first
-  → Click "Refresh Patterns"
-  → Check server connectivity with "Test"
+    Records below ERROR stay in the buffer; a daemon thread flushes it every
+    LOG_FLUSH_INTERVAL seconds and logging.shutdown() flushes it at exit.
+    """
 
-"Processing seems stuck"
-  → Click "Cancel" to abort
-  → Some AI models take longer than others
-  → Check your internet connection
+    def __init__(self, *args, flush_interval: float = LOG_FLUSH_INTERVAL, **kwargs):
+        kwargs.setdefault("delay", True)
+        super().__init__(*args, **kwargs)
+        self._defer_flush = False
+        # Running estimate of the file size; None forces a real tell() check
+        self._approx_size: Optional[int] = None
+        self._flush_stop = threading.Event()
+        self._flush_interval = flush_interval
+        self._flush_thread = threading.Thread(target=self._flush_loop, daemon=True)
+        self._flush_thread.start()
 
-"Ollama connection errors"
-  → This is normal if you don't have Ollama installed
-  → These messages are filtered from output
-  → Does not affect cloud models (GPT, Claude, etc.)
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=LOG_BUFFER_SIZE,
+                    encoding=self.encoding, errors=self.errors)
 
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-  ABOUT FABRIC
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    def _flush_loop(self) -> None:
+        while not self._flush_stop.wait(self._flush_interval):
+            self.flush()
 
-Fabric is an open-source AI framework by Daniel Miessler.
-Learn more: https://github.com/danielmiessler/fabric
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        # Only seek/tell on the stream once the running estimate nears maxBytes
+        if self.maxBytes <= 0:
+            return False
+        size = len(("%s\n" % self.format(record)).encode(self.encoding or "utf-8", "replace"))
+        if self._approx_size is not None and self._approx_size + size < self.maxBytes:
+            self._approx_size += size
+            return False
 
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-  CREDITS
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+        rollover = bool(super().shouldRollover(record))
+        if rollover:
+            self._approx_size = None
+        else:
+            self._approx_size = (self.stream.tell() if self.stream else 0) + size
+        return rollover
 
-Fabric GUI designed and developed by DigitalGods.ai
-https://digitalgods.ai
+    def emit(self, record: logging.LogRecord) -> None:
+        # StreamHandler.emit() flushes after every record; only let errors through
+        self._defer_flush = record.levelno < logging.ERROR
+        try:
+            super().emit(record)
+        finally:
+            self._defer_flush = False
 
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-"""
+    def flush(self) -> None:
+        if self._defer_flush:
+            return
+        super().flush()
 
-# -----------------------------
-# Logging
-# -----------------------------
+    def close(self) -> None:
+        self._flush_stop.set()
+        super().close()
 
-LOG_DIR = Path.home() / ".fabric_gui"
-LOG_DIR.mkdir(exist_ok=True)
-LOG_FILE = LOG_DIR / "fabric_gui.log"
 
-rotating_handler = logging.handlers.RotatingFileHandler(
+rotating_handler = BufferedRotatingFileHandler(
     LOG_FILE,
     maxBytes=LOG_MAX_BYTES,
     backupCount=LOG_BACKUP_COUNT,
     encoding="utf-8",
 )
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-    handlers=[rotating_handler, logging.StreamHandler()],
+_log_formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+rotating_handler.setFormatter(_log_formatter)
+_console_handler = logging.StreamHandler()
+_console_handler.setFormatter(_log_formatter)
+
+# Callers only enqueue records; the file and console handlers run on the
+# listener's thread, so logging never blocks the Tk or worker threads on I/O
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+# prepare() merges args into the message; the timestamp etc. are added by the real handlers
+_queue_handler.setFormatter(logging.Formatter("%(message)s"))
+log_listener = logging.handlers.QueueListener(
+    _log_queue, rotating_handler, _console_handler, respect_handler_level=True
 )
+log_listener.start()
+# Registered after logging's own shutdown hook, so it runs first and drains the queue
+atexit.register(log_listener.stop)
+
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
 logger = logging.getLogger("fabric_gui")
+# Pre-bound for the per-line/per-status call sites
+_log_info = logger.info
+
+
+# -----------------------------
+# File Helpers
+# -----------------------------
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write data to a sibling temp file in one call, fsync it, then os.replace() over path.
+
+    A crash mid-write leaves the previous file intact instead of a truncated one.
+    """
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
 
 
 # -----------------------------
@@ -248,7 +254,8 @@ logger = logging.getLogger("fabric_gui")
 class ConfigManager:
     CONFIG_FILE = LOG_DIR / "config.json"
 
-    DEFAULT_CONFIG = {
+    # Read-only so the shared defaults can never be mutated through a loaded config
+    DEFAULT_CONFIG: Mapping[str, Any] = MappingProxyType({
         "base_url": "http://localhost:8083",
         "last_pattern": "",
         "last_model": "",
@@ -259,15 +266,41 @@ class ConfigManager:
         "fabric_command": "fabric",
         # Fabric uses --address= for server bind, not --port
         "port_flag": "--address",
-    }
+    })
+
+    # Serializes saves coming from the UI thread and background writers
+    _save_lock = threading.Lock()
+
+    # Parsed config cached after the first load, keyed by the file's mtime
+    _cached: Optional[Dict[str, Any]] = None
+    _cached_mtime: float = 0.0
+    # Serialized config as last read or written; save() skips identical writes
+    _last_written_bytes: bytes = b""
+
+    @staticmethod
+    def _encode(config: Dict[str, Any]) -> bytes:
+        return json.dumps(config, indent=2, ensure_ascii=False).encode("utf-8")
+
+    @classmethod
+    def _mtime(cls) -> float:
+        try:
+            return cls.CONFIG_FILE.stat().st_mtime
+        except OSError:
+            return 0.0
 
     @classmethod
     def load(cls) -> Dict[str, Any]:
-        cfg = cls.DEFAULT_CONFIG.copy()
+        mtime = cls._mtime()
+        if cls._cached is not None and mtime == cls._cached_mtime:
+            # Values are all scalars, so a shallow copy is enough
+            return dict(cls._cached)
+
+        cfg = dict(cls.DEFAULT_CONFIG)
+        disk: Dict[str, Any] = {}
         changed = False
 
         try:
-            if cls.CONFIG_FILE.exists():
+            if mtime:
                 with open(cls.CONFIG_FILE, "r", encoding="utf-8") as f:
                     disk = json.load(f)
                 cfg.update(disk)
@@ -299,16 +332,41 @@ class ConfigManager:
             cfg["base_url"] = "http://localhost:8083"
             changed = True
 
-        if changed:
+        # Only rewrite when the migrated config really differs from what is on disk;
+        # dict equality ignores key order, so neither side needs serializing
+        if changed and cfg != disk:
             cls.save(cfg)
+        else:
+            cls._cached = dict(cfg)
+            cls._cached_mtime = mtime
+            cls._last_written_bytes = cls._encode(cfg)
 
         return cfg
 
+    @classmethod
+    def invalidate(cls) -> None:
+        """Drop the cached config so the next load() re-reads the file."""
+        with cls._save_lock:
+            cls._cached = None
+            cls._cached_mtime = 0.0
+
     @classmethod
     def save(cls, config: Dict[str, Any]) -> None:
+        with cls._save_lock:
+            cls._save(config)
+
+    @classmethod
+    def _save(cls, config: Dict[str, Any]) -> None:
         try:
-            with open(cls.CONFIG_FILE, "w", encoding="utf-8") as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
+            # Serialize once; the same bytes serve the dirty check and the write
+            payload = cls._encode(config)
+            if payload == cls._last_written_bytes:
+                logger.debug("Configuration unchanged; skipping save")
+                return
+            _atomic_write_bytes(cls.CONFIG_FILE, payload)
+            cls._last_written_bytes = payload
+            cls._cached = dict(config)
+            cls._cached_mtime = cls._mtime()
             logger.info("Configuration saved")
         except Exception as e:
             logger.error(f"Failed to save config: {e}")
@@ -319,31 +377,51 @@ class ConfigManager:
 # -----------------------------
 
 class OutputHistory:
-    HISTORY_FILE = LOG_DIR / "history.json"
+    # Append-only JSON Lines log: one record per add/update, compacted periodically
+    HISTORY_FILE = LOG_DIR / "history.jsonl"
+    LEGACY_HISTORY_FILE = LOG_DIR / "history.json"
 
     def __init__(self, max_size: int = MAX_HISTORY_SIZE):
-        self.history: List[Dict[str, str]] = []
         self.max_size = max_size
+        self.history: "collections.deque[Dict[str, str]]" = collections.deque(maxlen=max_size)
         self.current_index = -1
+
+        self._save_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._pending_records: List[bytes] = []
+        self._compact_pending = False
+        self._records_since_compact = 0
+        self._save_timer: Optional[threading.Timer] = None
+
         self.load()
 
-    def add(self, pattern: str, input_text: str, output_text: str) -> None:
+    def add(self, pattern: str, input_text: str, output_text: str) -> Dict[str, str]:
+        """Append a new entry and return it so callers can fill in its output later."""
         entry = {
             "timestamp": datetime.now().isoformat(),
             "pattern": pattern,
             "input": input_text,
             "output": output_text,
         }
-        self.history.append(entry)
-        if len(self.history) > self.max_size:
-            self.history.pop(0)
-        self.current_index = len(self.history) - 1
-        self.save()
-
-    def update_current_output(self, output_text: str) -> None:
-        if 0 <= self.current_index < len(self.history):
-            self.history[self.current_index]["output"] = output_text
-            self.save()
+        with self._save_lock:
+            # deque(maxlen=...) evicts the oldest entry in O(1)
+            self.history.append(entry)
+            self.current_index = len(self.history) - 1
+            self._queue_record({"op": "add", "entry": entry})
+        return entry
+
+    def set_output(self, entry: Dict[str, str], output_text: str) -> None:
+        """Set the output of an entry returned by add(), even if the user has
+        navigated elsewhere in the history since."""
+        with self._save_lock:
+            entry["output"] = output_text
+            # The entry is almost always the newest one, so search from the end.
+            # Iterate rather than index: deque indexing walks from the nearer end
+            last = len(self.history) - 1
+            for offset, item in enumerate(reversed(self.history)):
+                if item is entry:
+                    self._queue_record({"op": "update", "index": last - offset, "output": output_text})
+                    break
 
     def previous(self) -> Optional[Dict[str, str]]:
         if self.current_index > 0:
@@ -363,28 +441,103 @@ class OutputHistory:
     def has_next(self) -> bool:
         return self.current_index < len(self.history) - 1
 
+    def _replay(self, record: Dict[str, Any]) -> None:
+        op = record.get("op")
+        if op == "add":
+            self.history.append(record.get("entry", {}))
+        elif op == "update":
+            index = record.get("index", -1)
+            if 0 <= index < len(self.history):
+                self.history[index]["output"] = record.get("output", "")
+
     def load(self) -> None:
         try:
             if self.HISTORY_FILE.exists():
-                with open(self.HISTORY_FILE, "r", encoding="utf-8") as f:
+                records = 0
+                # Bytes go straight to the parser; no per-line UTF-8 decode to str
+                with open(self.HISTORY_FILE, "rb") as f:
+                    for line in f:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        try:
+                            self._replay(_json_loads(line))
+                        except ValueError:
+                            # Torn trailing write from a crash; skip it
+                            continue
+                        records += 1
+                self._records_since_compact = records
+            elif self.LEGACY_HISTORY_FILE.exists():
+                with open(self.LEGACY_HISTORY_FILE, "r", encoding="utf-8") as f:
                     data = json.load(f)
-                self.history = data.get("history", [])
-                if len(self.history) > self.max_size:
-                    self.history = self.history[-self.max_size :]
-                if self.history:
-                    self.current_index = len(self.history) - 1
-                logger.info(f"Loaded {len(self.history)} history entries")
+                self.history = collections.deque(data.get("history", []), maxlen=self.max_size)
+                self.save()
+
+            if self.history:
+                self.current_index = len(self.history) - 1
+            logger.info(f"Loaded {len(self.history)} history entries")
         except Exception as e:
             logger.error(f"Failed to load history: {e}")
-            self.history = []
+            self.history = collections.deque(maxlen=self.max_size)
             self.current_index = -1
 
+    def _queue_record(self, record: Dict[str, Any]) -> None:
+        # Caller holds _save_lock
+        self._pending_records.append(_json_dumps_bytes(record))
+        self._records_since_compact += 1
+        if self._records_since_compact >= self.max_size * 2:
+            self._compact_pending = True
+        self._arm_timer()
+
+    def _arm_timer(self) -> None:
+        # Caller holds _save_lock; writes within HISTORY_SAVE_DELAY are coalesced
+        if self._save_timer is None:
+            self._save_timer = threading.Timer(HISTORY_SAVE_DELAY, self._flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
     def save(self) -> None:
-        try:
-            with open(self.HISTORY_FILE, "w", encoding="utf-8") as f:
-                json.dump({"history": self.history}, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            logger.error(f"Failed to save history: {e}")
+        """Schedule a compaction that rewrites the log with only the current entries."""
+        with self._save_lock:
+            self._compact_pending = True
+            self._arm_timer()
+
+    def flush_sync(self) -> None:
+        """Write pending records and compact the log immediately (used on shutdown)."""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._compact_pending = True
+        self._flush()
+
+    def _flush(self) -> None:
+        # _write_lock spans snapshot and write so a compaction can never be
+        # followed by a stale append of records it already contains
+        with self._write_lock:
+            with self._save_lock:
+                self._save_timer = None
+                records = self._pending_records
+                self._pending_records = []
+                compact = self._compact_pending
+                self._compact_pending = False
+                snapshot = list(self.history) if compact else None
+                if compact:
+                    self._records_since_compact = len(snapshot)
+
+            if not records and not compact:
+                return
+
+            try:
+                if compact:
+                    _atomic_write_bytes(self.HISTORY_FILE, b"".join(
+                        _json_dumps_bytes({"op": "add", "entry": entry}) + b"\n"
+                        for entry in snapshot
+                    ))
+                else:
+                    with open(self.HISTORY_FILE, "ab") as f:
+                        f.write(b"\n".join(records) + b"\n")
+            except Exception as e:
+                logger.error(f"Failed to save history: {e}")
 
 
 # -----------------------------
@@ -392,20 +545,45 @@ class OutputHistory:
 # -----------------------------
 
 class ServerManager:
+    # Last pattern list (and ETag) per server URL, so startup can fill the combobox before the server answers
+    PATTERNS_CACHE_FILE = LOG_DIR / "patterns_cache.json"
+
     def __init__(self, fabric_command: str, base_url: str, port_flag: str):
         self.fabric_command = fabric_command
         self.base_url = self._normalize_base_url(base_url)
         self.port_flag = port_flag.strip() if port_flag else "--address"
 
+        # shutil.which() walks PATH (x PATHEXT on Windows); resolve once and reuse
+        self._fabric_path: Optional[str] = None
+        self._fabric_path_for: Optional[str] = None
+        self._resolve_fabric()
+
         self.process: Optional[subprocess.Popen] = None
         self.is_online = False
 
-        self._health_thread: Optional[threading.Thread] = None
-        self._stop_health = False
+        # (monotonic timestamp, .env mtime, fabric path, models) from the last --listmodels run
+        self._models_cache: Optional[tuple] = None
+        # (monotonic timestamp, base_url, patterns) from the last successful /patterns/names
+        self._patterns_cache: Optional[tuple] = None
+        # {base_url: {"etag": ..., "patterns": [...]}} mirrored from PATTERNS_CACHE_FILE, read on first use
+        self._patterns_disk: Optional[Dict[str, Dict[str, Any]]] = None
+        self._patterns_disk_lock = threading.Lock()
+
+        # One pooled session so health probes and pattern fetches reuse the
+        # keep-alive connection instead of reconnecting on every call
+        self._session: Optional["requests.Session"] = None
+        self._session_lock = threading.Lock()
+
+        # Backoff state for next_health_delay(); polling itself is driven by the GUI
+        self._health_delay = HEALTH_CHECK_MIN_INTERVAL
+        self._health_last_online: Optional[bool] = None
+        # Cleared once the server is seen answering GET but not HEAD
+        self._health_use_head = True
+        self._fast_poll_until = 0.0
 
         self._server_log_thread: Optional[threading.Thread] = None
         self._server_log_stop = False
-        self.last_server_lines: List[str] = []
+        self.last_server_lines: "collections.deque[str]" = collections.deque(maxlen=SERVER_OUTPUT_TAIL)
 
     @staticmethod
     def _normalize_base_url(url: str) -> str:
@@ -426,63 +604,133 @@ class ServerManager:
         return 80
 
     def set_base_url(self, base_url: str) -> None:
-        self.base_url = self._normalize_base_url(base_url)
+        base_url = self._normalize_base_url(base_url)
+        if base_url != self.base_url:
+            self._health_use_head = True
+        self.base_url = base_url
+
+    def _resolve_fabric(self) -> Optional[str]:
+        """Return the cached fabric executable path, re-resolving if the command
+        changed or the cached file disappeared."""
+        if (
+            self._fabric_path_for == self.fabric_command
+            and self._fabric_path
+            and os.path.exists(self._fabric_path)
+        ):
+            return self._fabric_path
+        self._fabric_path = shutil.which(self.fabric_command)
+        self._fabric_path_for = self.fabric_command
+        return self._fabric_path
+
+    def _get_session(self) -> "requests.Session":
+        """Return the shared session, creating it on first use. requests is
+        imported here so its import cost lands on the first background probe
+        rather than on application startup."""
+        session = self._session
+        if session is not None:
+            return session
+        with self._session_lock:
+            if self._session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=2, pool_maxsize=NET_WORKERS)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                session.headers.update({"Connection": "keep-alive", "Accept-Encoding": "gzip"})
+                self._session = session
+            return self._session
+
+    def port_open(self) -> bool:
+        """Cheap TCP connect to the server's host:port, without an HTTP round trip."""
+        try:
+            parsed = urlparse(self.base_url)
+            host = parsed.hostname or "localhost"
+            port = parsed.port or (443 if parsed.scheme == "https" else 80)
+        except ValueError:
+            return False
+        # create_connection tries every resolved address, so "localhost" works over IPv4 or IPv6
+        try:
+            socket.create_connection((host, port), timeout=SERVER_PORT_PROBE_TIMEOUT).close()
+            return True
+        except OSError:
+            return False
+
+    def probe_ready(self) -> bool:
+        """Readiness check used while a launched server boots: HTTP only once the port accepts."""
+        return self.port_open() and self.check_health()
 
     def check_health(self) -> bool:
+        url = f"{self.base_url}/config"
         try:
-            resp = requests.get(f"{self.base_url}/config", timeout=2)
+            session = self._get_session()
+            # HEAD skips the config body; fall back to GET for servers that
+            # don't route HEAD, and remember that for later probes
+            if self._health_use_head:
+                resp = session.head(url, timeout=2, allow_redirects=False)
+                if resp.status_code == 200:
+                    self.is_online = True
+                    return True
+            resp = session.get(url, timeout=2)
             healthy = resp.status_code == 200
+            if healthy and self._health_use_head:
+                self._health_use_head = False
             self.is_online = healthy
             return healthy
         except Exception:
             self.is_online = False
             return False
 
-    def start_health_monitoring(self, interval: int, callback: Optional[callable] = None) -> None:
-        if self._health_thread and self._health_thread.is_alive():
-            return
-
-        self._stop_health = False
-
-        def _loop():
-            while not self._stop_health:
-                online = self.check_health()
-                if callback:
-                    try:
-                        callback(online)
-                    except Exception:
-                        pass
-                time.sleep(max(1, int(interval)))
-
-        self._health_thread = threading.Thread(target=_loop, daemon=True)
-        self._health_thread.start()
-        logger.info(f"Health monitoring started (interval: {interval}s)")
-
-    def stop_health_monitoring(self) -> None:
-        self._stop_health = True
-        if self._health_thread:
-            self._health_thread.join(timeout=2)
+    def next_health_delay(self, online: bool, interval: int) -> float:
+        """Seconds until the next health probe. Polls quickly after a state change
+        or server start and backs off exponentially to `interval` while stable."""
+        if online != self._health_last_online:
+            self._health_delay = HEALTH_CHECK_MIN_INTERVAL
+        else:
+            self._health_delay = min(self._health_delay * 2, max(1, int(interval)))
+        self._health_last_online = online
+        if time.monotonic() < self._fast_poll_until:
+            return HEALTH_CHECK_MIN_INTERVAL
+        return self._health_delay
 
     def _start_server_output_capture(self) -> None:
         if not self.process or not self.process.stdout:
             return
 
         self._server_log_stop = False
-        self.last_server_lines = []
+        self.last_server_lines = collections.deque(maxlen=SERVER_OUTPUT_TAIL)
+
+        stdout = self.process.stdout
+
+        def _emit(line: str) -> None:
+            line = line.rstrip("\r")
+            if not line:
+                return
+            self.last_server_lines.append(line)
+            _log_info("[fabric --serve] %s", line)
 
         def _reader():
+            # Read whatever is available in one call and split it ourselves,
+            # carrying any partial trailing line over to the next chunk
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            # Pieces of an unterminated line, joined once its newline arrives
+            partial: List[str] = []
             try:
                 while not self._server_log_stop:
-                    line = self.process.stdout.readline()
-                    if not line:
+                    chunk = stdout.read1(OUTPUT_READ_SIZE)
+                    if not chunk:
                         break
-                    line = line.rstrip("\r\n")
-                    if not line:
-                        continue
-                    self.last_server_lines.append(line)
-                    if len(self.last_server_lines) > 50:
-                        self.last_server_lines.pop(0)
-                    logger.info(f"[fabric --serve] {line}")
+                    *lines, tail = decoder.decode(chunk).split("\n")
+                    if lines:
+                        lines[0] = "".join(partial) + lines[0]
+                        partial = []
+                        for line in lines:
+                            _emit(line)
+                    if tail:
+                        partial.append(tail)
+                partial.append(decoder.decode(b"", final=True))
+                _emit("".join(partial))
             except Exception as e:
                 logger.error(f"Server output capture error: {e}")
 
@@ -501,7 +749,7 @@ class ServerManager:
         port = self._port_from_base_url(self.base_url)
 
         try:
-            fabric_path = shutil.which(self.fabric_command)
+            fabric_path = self._resolve_fabric()
             if not fabric_path:
                 logger.error(f"Fabric command not found: {self.fabric_command}")
                 return False
@@ -517,30 +765,24 @@ class ServerManager:
 
             self.process = subprocess.Popen(
                 cmd,
+                stdin=subprocess.DEVNULL,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
-                encoding="utf-8",
-                errors="replace",
-                bufsize=1,
+                bufsize=OUTPUT_READ_SIZE,
                 creationflags=creationflags,
             )
 
             logger.info(f"Server process started with PID: {self.process.pid}")
+            self._fast_poll_until = time.monotonic() + HEALTH_FAST_POLL_WINDOW
             self._start_server_output_capture()
-
-            time.sleep(2)
-            if self.process.poll() is not None:
-                logger.error("Server process terminated immediately")
-                return False
-
+            # Readiness is probed by the caller (see FabricGUI._wait_for_server)
             return True
 
         except Exception as e:
             logger.error(f"Failed to start server: {e}")
             return False
 
-    def stop_server(self, timeout: int = 5) -> bool:
+    def stop_server(self, timeout: float = SERVER_STOP_TIMEOUT) -> bool:
         if not self.process or self.process.poll() is not None:
             self.process = None
             self.is_online = False
@@ -552,10 +794,10 @@ class ServerManager:
 
             self._server_log_stop = True
 
-            if os.name == "nt":
-                self.process.terminate()
-            else:
-                self.process.terminate()
+            # SIGTERM on POSIX. On Windows this is TerminateProcess: the server
+            # runs without a console (CREATE_NO_WINDOW), so CTRL_BREAK_EVENT
+            # could not be delivered to its process group anyway
+            self.process.terminate()
 
             try:
                 self.process.wait(timeout=timeout)
@@ -572,71 +814,141 @@ class ServerManager:
             logger.error(f"Failed to stop server: {e}")
             return False
 
-    def get_patterns(self) -> Optional[List[str]]:
+    def invalidate_patterns(self) -> None:
+        self._patterns_cache = None
+
+    def _load_patterns_disk(self) -> Dict[str, Dict[str, Any]]:
+        # Caller holds _patterns_disk_lock
+        if self._patterns_disk is None:
+            self._patterns_disk = {}
+            try:
+                with open(self.PATTERNS_CACHE_FILE, "rb") as f:
+                    data = _json_loads(f.read())
+                if isinstance(data, dict):
+                    self._patterns_disk = data
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.error(f"Failed to read patterns cache: {e}")
+        return self._patterns_disk
+
+    def cached_patterns(self) -> Optional[Sequence[str]]:
+        """Patterns last fetched from the current server URL, read from disk without a request."""
+        with self._patterns_disk_lock:
+            entry = self._load_patterns_disk().get(self.base_url)
+        if not entry or not isinstance(entry.get("patterns"), list):
+            return None
+        return tuple(map(sys.intern, entry["patterns"]))
+
+    def _store_patterns_disk(self, base_url: str, etag: Optional[str], patterns: Sequence[str]) -> None:
+        with self._patterns_disk_lock:
+            disk = self._load_patterns_disk()
+            entry = {"etag": etag, "patterns": list(patterns)}
+            if disk.get(base_url) == entry:
+                return
+            disk[base_url] = entry
+            try:
+                _atomic_write_bytes(self.PATTERNS_CACHE_FILE, _json_dumps_bytes(disk))
+            except Exception as e:
+                logger.error(f"Failed to write patterns cache: {e}")
+
+    def server_exited(self) -> bool:
+        return self.process is None or self.process.poll() is not None
+
+    def get_patterns(self) -> Optional[Sequence[str]]:
+        if self._patterns_cache:
+            ts, url, patterns = self._patterns_cache
+            if url == self.base_url and time.monotonic() - ts < PATTERNS_CACHE_TTL:
+                return patterns
+        base_url = self.base_url
         try:
-            resp = requests.get(f"{self.base_url}/patterns/names", timeout=5)
+            # Revalidate the list saved on disk; a 304 costs no body transfer or parsing
+            with self._patterns_disk_lock:
+                entry = self._load_patterns_disk().get(base_url) or {}
+            etag = entry.get("etag")
+            headers = {"If-None-Match": etag} if etag else None
+            resp = self._get_session().get(f"{base_url}/patterns/names", headers=headers, timeout=5)
+            if resp.status_code == 304 and isinstance(entry.get("patterns"), list):
+                patterns = tuple(map(sys.intern, entry["patterns"]))
+                self._patterns_cache = (time.monotonic(), base_url, patterns)
+                return patterns
             if resp.status_code != 200:
                 return []
-            data = resp.json()
-            if isinstance(data, list):
-                return sorted(data)
+            # Parse the raw body directly instead of decoding it to text first
+            data = _json_loads(resp.content)
             if isinstance(data, dict):
-                patterns = data.get("patterns", [])
-                if isinstance(patterns, list):
-                    return sorted(patterns)
-            return []
+                data = data.get("patterns", [])
+            if not isinstance(data, list):
+                return []
+            # Sorted once here; the immutable tuple is shared with every cache hit
+            patterns = tuple(sorted(map(sys.intern, data)))
+            self._patterns_cache = (time.monotonic(), base_url, patterns)
+            self._store_patterns_disk(base_url, resp.headers.get("ETag"), patterns)
+            return patterns
         except Exception as e:
             logger.error(f"Failed to get patterns: {e}")
             return None
 
+    @staticmethod
+    def _fabric_env_mtime() -> float:
+        try:
+            return FABRIC_ENV_FILE.stat().st_mtime
+        except OSError:
+            return 0.0
+
     def get_models(self) -> Dict[str, List[str]]:
         try:
-            fabric_path = shutil.which(self.fabric_command)
+            fabric_path = self._resolve_fabric()
             if not fabric_path:
                 return {}
 
+            env_mtime = self._fabric_env_mtime()
+            if self._models_cache:
+                ts, mtime, path, models = self._models_cache
+                if (
+                    time.monotonic() - ts < MODELS_CACHE_TTL
+                    and mtime == env_mtime
+                    and path == fabric_path
+                ):
+                    return dict(models)
+
             creationflags = 0
             if os.name == "nt":
                 creationflags = subprocess.CREATE_NO_WINDOW
 
             result = subprocess.run(
                 [fabric_path, "--listmodels"],
+                stdin=subprocess.DEVNULL,
                 capture_output=True,
-                text=True,
-                encoding="utf-8",
-                errors="replace",
                 creationflags=creationflags,
+                timeout=MODELS_LIST_TIMEOUT,
             )
             if result.returncode != 0:
-                logger.error(f"Failed to list models: {result.stderr.strip()}")
+                logger.error(f"Failed to list models: {result.stderr.decode('utf-8', 'replace').strip()}")
                 return {}
 
-            models_by_provider: Dict[str, List[str]] = {}
-            for line in result.stdout.splitlines():
-                line = line.strip()
-                if not line:
-                    continue
-                m = re.match(r"^\[\d+\]\s*(.*)$", line)
-                if not m:
-                    continue
-                content = m.group(1).strip()
+            acc: Dict[str, set] = {}
+            for m in _MODEL_LINE_RE.finditer(result.stdout):
+                content = m.group(1).decode("utf-8", "replace")
 
-                if "|" in content:
-                    provider, model = content.split("|", 1)
+                provider, sep, model = content.partition("|")
+                if sep:
                     provider = provider.strip() or "Other"
                     model = model.strip()
                 else:
                     provider = "Other"
-                    model = content.strip()
+                    model = content
 
                 if not model:
                     continue
-                models_by_provider.setdefault(provider, []).append(model)
+                acc.setdefault(provider, set()).add(model)
 
-            for k in list(models_by_provider.keys()):
-                models_by_provider[k] = sorted(list(dict.fromkeys(models_by_provider[k])))
-
-            return dict(sorted(models_by_provider.items(), key=lambda kv: kv[0].lower()))
+            # Sets dedupe on insert; sort each provider once at the end
+            models_by_provider = {k: sorted(v) for k, v in acc.items()}
+            models = dict(sorted(models_by_provider.items(), key=lambda kv: kv[0].lower()))
+            if models:
+                self._models_cache = (time.monotonic(), env_mtime, fabric_path, models)
+            return dict(models)
 
         except Exception as e:
             logger.error(f"Error getting models: {e}")
@@ -644,11 +956,10 @@ class ServerManager:
 
     def get_default_model(self) -> Optional[str]:
         try:
-            config_path = Path.home() / ".config" / "fabric" / ".env"
-            if not config_path.exists():
+            if not FABRIC_ENV_FILE.exists():
                 return None
-            content = config_path.read_text(encoding="utf-8", errors="replace")
-            m = re.search(r"^DEFAULT_MODEL=(.+)$", content, re.MULTILINE)
+            content = FABRIC_ENV_FILE.read_text(encoding="utf-8", errors="replace")
+            m = _DEFAULT_MODEL_RE.search(content)
             if m:
                 return m.group(1).strip()
             return None
@@ -659,59 +970,116 @@ class ServerManager:
     def is_running(self) -> bool:
         return self.is_online
 
+    def close(self) -> None:
+        if self._session is None:
+            return
+        try:
+            self._session.close()
+        except Exception:
+            pass
+
+
+# -----------------------------
+# Async Worker
+# -----------------------------
+
+class AsyncWorker:
+    """Runs a private asyncio event loop on a single daemon thread."""
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def submit(self, coro) -> concurrent.futures.Future:
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def call_soon(self, callback, *args) -> None:
+        self.loop.call_soon_threadsafe(callback, *args)
+
+    def stop(self) -> None:
+        self.loop.call_soon_threadsafe(self.loop.stop)
+
 
 # -----------------------------
 # Context Menu
 # -----------------------------
 
 class ContextMenu:
+    # One tk.Menu shared by every widget; the right-clicked widget is the target
+    _menu: Optional[tk.Menu] = None
+    _target: Optional[tk.Widget] = None
+
     def __init__(self, widget: tk.Widget):
         self.widget = widget
-        self.menu = tk.Menu(widget, tearoff=0)
-        self.menu.add_command(label="Cut", command=lambda: self._gen("<<Cut>>"))
-        self.menu.add_command(label="Copy", command=lambda: self._gen("<<Copy>>"))
-        self.menu.add_command(label="Paste", command=lambda: self._gen("<<Paste>>"))
-        self.menu.add_separator()
-        self.menu.add_command(label="Select All", command=self._select_all)
         widget.bind("<Button-3>", self._show)
 
-    def _gen(self, ev: str) -> None:
+    @classmethod
+    def _get_menu(cls, widget: tk.Widget) -> tk.Menu:
+        if cls._menu is None:
+            menu = tk.Menu(widget.nametowidget("."), tearoff=0)
+            menu.add_command(label="Cut", command=lambda: cls._gen("<<Cut>>"))
+            menu.add_command(label="Copy", command=lambda: cls._gen("<<Copy>>"))
+            menu.add_command(label="Paste", command=lambda: cls._gen("<<Paste>>"))
+            menu.add_separator()
+            menu.add_command(label="Select All", command=cls._select_all)
+            cls._menu = menu
+        return cls._menu
+
+    @classmethod
+    def _gen(cls, ev: str) -> None:
         try:
-            self.widget.event_generate(ev)
+            cls._target.event_generate(ev)
         except Exception:
             pass
 
-    def _select_all(self) -> None:
+    @classmethod
+    def _select_all(cls) -> None:
+        widget = cls._target
         try:
-            self.widget.focus_force()
-            if isinstance(self.widget, tk.Text):
-                self.widget.tag_add("sel", "1.0", "end")
-            elif isinstance(self.widget, tk.Entry):
-                self.widget.select_range(0, "end")
+            widget.focus_force()
+            if isinstance(widget, tk.Text):
+                widget.tag_add("sel", "1.0", "end")
+            elif isinstance(widget, tk.Entry):
+                widget.select_range(0, "end")
         except Exception:
             pass
 
     def _show(self, event) -> None:
+        menu = self._get_menu(self.widget)
+        ContextMenu._target = self.widget
+
         try:
             state = str(self.widget.cget("state"))
         except Exception:
             state = "normal"
 
         readonly = state in ("disabled", "readonly")
-        self.menu.entryconfig("Cut", state="disabled" if readonly else "normal")
-        self.menu.entryconfig("Paste", state="disabled" if readonly else "normal")
+        menu.entryconfig("Cut", state="disabled" if readonly else "normal")
+        menu.entryconfig("Paste", state="disabled" if readonly else "normal")
 
+        # Ask the widget itself; selection_get() goes through the PRIMARY
+        # selection and can round-trip to whichever application owns it
         try:
-            _ = self.widget.selection_get()
-            has_sel = True
+            if isinstance(self.widget, tk.Text):
+                has_sel = bool(self.widget.tag_ranges("sel"))
+            elif isinstance(self.widget, tk.Entry):
+                has_sel = bool(self.widget.selection_present())
+            else:
+                self.widget.selection_get()
+                has_sel = True
         except Exception:
             has_sel = False
 
-        self.menu.entryconfig("Copy", state="normal" if has_sel else "disabled")
+        menu.entryconfig("Copy", state="normal" if has_sel else "disabled")
         if not readonly:
-            self.menu.entryconfig("Cut", state="normal" if has_sel else "disabled")
+            menu.entryconfig("Cut", state="normal" if has_sel else "disabled")
 
-        self.menu.tk_popup(event.x_root, event.y_root)
+        menu.tk_popup(event.x_root, event.y_root)
 
 
 # -----------------------------
@@ -728,17 +1096,14 @@ class PreferencesDialog(ctk.CTkToplevel):
         self.result: Optional[Dict[str, Any]] = None
 
         self.title("Preferences")
-        self.geometry("500x420")
+        # Center over the parent with a single placement
+        x = parent.winfo_x() + max(0, (parent.winfo_width() - 500) // 2)
+        y = parent.winfo_y() + max(0, (parent.winfo_height() - 420) // 2)
+        self.geometry(f"500x420+{x}+{y}")
         self.resizable(False, False)
         self.transient(parent)
         self.grab_set()
 
-        # Center the dialog
-        self.update_idletasks()
-        x = parent.winfo_x() + (parent.winfo_width() // 2) - 250
-        y = parent.winfo_y() + (parent.winfo_height() // 2) - 210
-        self.geometry(f"+{x}+{y}")
-
         # Variables for settings
         self.base_url_var = tk.StringVar(value=self.config.get("base_url", "http://localhost:8083"))
         self.auto_start_var = tk.BooleanVar(value=self.config.get("auto_start_server", False))
@@ -749,8 +1114,9 @@ class PreferencesDialog(ctk.CTkToplevel):
 
         self._build_ui()
 
-        # Handle window close
+        # Handle window close; Escape takes the same path
         self.protocol("WM_DELETE_WINDOW", self._on_cancel)
+        self.bind("<Escape>", lambda _e: self._on_cancel())
 
     def _build_ui(self) -> None:
         # Tabview
@@ -882,9 +1248,9 @@ class PreferencesDialog(ctk.CTkToplevel):
             "base_url": base_url,
             "auto_start_server": self.auto_start_var.get(),
             "stop_server_on_exit": self.stop_on_exit_var.get(),
-            "server_health_check_interval": int(self.health_interval_var.get()),
+            "server_health_check_interval": health_int,
             "fabric_command": fabric_cmd,
-            "request_timeout": int(self.timeout_var.get()),
+            "request_timeout": timeout,
         }
 
     def _on_save(self) -> None:
@@ -898,6 +1264,46 @@ class PreferencesDialog(ctk.CTkToplevel):
         self.destroy()
 
 
+# -----------------------------
+# Info Dialog
+# -----------------------------
+
+class InfoDialog(ctk.CTkToplevel):
+    """Reusable message dialog, built once and withdrawn between uses."""
+
+    WIDTH = 400
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.withdraw()
+        self.parent = parent
+        self.resizable(False, False)
+        self.transient(parent)
+
+        self._label = ctk.CTkLabel(self, text="", justify="left", wraplength=self.WIDTH - 40)
+        self._label.pack(padx=20, pady=(20, 10))
+        ctk.CTkButton(self, text="OK", command=self.hide, width=100).pack(pady=(0, 15))
+
+        self.protocol("WM_DELETE_WINDOW", self.hide)
+        self.bind("<Return>", lambda _e: self.hide())
+        self.bind("<Escape>", lambda _e: self.hide())
+
+    def show(self, title: str, text: str) -> None:
+        self.title(title)
+        self._label.configure(text=text)
+        x = self.parent.winfo_x() + max(0, (self.parent.winfo_width() - self.WIDTH) // 2)
+        y = self.parent.winfo_y() + max(0, self.parent.winfo_height() // 3)
+        self.geometry(f"+{x}+{y}")
+        self.deiconify()
+        self.lift()
+        self.focus_force()
+        self.grab_set()
+
+    def hide(self) -> None:
+        self.grab_release()
+        self.withdraw()
+
+
 # -----------------------------
 # GUI
 # -----------------------------
@@ -947,9 +1353,47 @@ class FabricGUI(ctk.CTk):
 
         # runtime state
         self.cancel_request = False
-        self.current_request_thread: Optional[threading.Thread] = None
-        self.current_process: Optional[subprocess.Popen] = None
-        
+        self.current_request: Optional[concurrent.futures.Future] = None
+        self.current_process: Optional[asyncio.subprocess.Process] = None
+        # fabric requests run as coroutines on this loop; only touched from its thread
+        self._async = AsyncWorker()
+        # Last base URL that passed _normalize_base_url_from_entry()
+        self._normalized_base_url: Optional[str] = None
+        # Environment for fabric subprocesses, built on the first request
+        self._request_env: Optional[Dict[str, str]] = None
+        # Blocking network calls run here and report back through after()
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=NET_WORKERS, thread_name_prefix="fabric-net")
+        # Config writes go through one worker so they reach disk in the order they were made
+        self._config_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="fabric-config")
+        self._health_after_id: Optional[str] = None
+        self._health_future: Optional[concurrent.futures.Future] = None
+        # Last (online, base_url) drawn on the LED and last logged transition
+        self._led_state: Optional[tuple] = None
+        self._last_logged_online: Optional[bool] = None
+        self._last_status_log_ts = 0.0
+        self._health_interval = int(self.app_config.get("server_health_check_interval", SERVER_HEALTH_CHECK_INTERVAL))
+        # Set once the window starts closing; late worker callbacks are ignored
+        self._shutting_down = False
+        self._closed = False
+        # Set while a launched server is being probed; health updates leave Start/Stop alone
+        self._server_starting = False
+
+        # User guide window, built on first open and reused afterwards
+        self._help_window: Optional[ctk.CTkToplevel] = None
+        # Shared dialog for About/log messages, same lifecycle as the help window
+        self._info_dialog: Optional[InfoDialog] = None
+
+        # Shared tooltip window, created on first hover
+        self._tooltip_win: Optional[tk.Toplevel] = None
+        self._tooltip_label: Optional[tk.Label] = None
+        self._tooltip_after: Optional[str] = None
+
+        # Streamed output from the worker thread, drained on the Tk thread in batches
+        self._out_queue: "queue.SimpleQueue[str]" = queue.SimpleQueue()
+        # Set by the worker when it arms a drain; cleared by the drain before it empties the queue
+        self._drain_scheduled = False
+        self._output_streaming = False
+
         # Progress animation state
         self._progress_animation_id: Optional[str] = None
         self._progress_dot_count = 0
@@ -964,12 +1408,29 @@ class FabricGUI(ctk.CTk):
         self.status_var = tk.StringVar(value="Ready")
         self.command_var = tk.StringVar(value="")
 
-        self.all_patterns: List[str] = []
+        self.all_patterns: Sequence[str] = ()
+        self._patterns_lower: List[str] = []  # parallel to all_patterns, for search
+        self._combo_values: Sequence[str] = ()  # mirrors pattern_combo["values"] without a Tcl round-trip
         self.last_valid_model = ""
+        self._models_cache_key: Optional[tuple] = None
+
+        # Debounced config persistence (see _queue_config_save)
+        self._config_dirty = False
+        self._config_save_after_id: Optional[str] = None
+
+        # Debounced history navigation (see _queue_history_nav)
+        self._history_nav_pending: Optional[Dict[str, str]] = None
+        self._history_nav_after_id: Optional[str] = None
 
-        self.pattern_var.trace_add("write", self._update_command_preview)
-        self.model_var.trace_add("write", self._update_command_preview)
-        self.pattern_search_var.trace_add("write", self._filter_patterns)
+        # Pending after() ids for debounced trace callbacks
+        self._filter_after: Optional[str] = None
+        self._last_filter_needle: Optional[str] = None
+        self._preview_after: Optional[str] = None
+        self._last_cmd_key: Optional[tuple] = None
+
+        self.pattern_var.trace_add("write", self._schedule_command_preview)
+        self.model_var.trace_add("write", self._schedule_command_preview)
+        self.pattern_search_var.trace_add("write", self._schedule_filter)
 
         self.title("Fabric GUI")
         self.geometry(self.app_config.get("window_geometry", DEFAULT_WINDOW_SIZE))
@@ -982,14 +1443,15 @@ class FabricGUI(ctk.CTk):
         self._build_io_frame()
         self._setup_shortcuts()
 
-        self.server_manager.start_health_monitoring(
-            interval=int(self.app_config.get("server_health_check_interval", SERVER_HEALTH_CHECK_INTERVAL)),
-            callback=self._on_server_status_change,
-        )
+        logger.info(f"Health monitoring started (interval: {self._health_interval}s)")
+        # Deferred so no probe result can arrive before mainloop() is running
+        self.after_idle(self._health_tick)
 
         if self.app_config.get("auto_start_server", False):
             self.after(600, self.on_start_server)
 
+        # Show the patterns saved from the last session right away; load_patterns replaces them
+        self._run_in_background(self.server_manager.cached_patterns, self._apply_cached_patterns)
         self.after(800, self.load_patterns)
         self.after(1200, self.load_models)
 
@@ -1039,30 +1501,44 @@ class FabricGUI(ctk.CTk):
         title = ctk.CTkLabel(frame, text="Server", font=FONT_HEADING)
         title.grid(row=0, column=0, columnspan=10, sticky="w", padx=10, pady=(6, 0))
 
-        content = ctk.CTkFrame(frame, fg_color="transparent")
-        content.grid(row=1, column=0, columnspan=10, sticky="ew", padx=5, pady=6)
-
-        led_frame = ctk.CTkFrame(content, fg_color="transparent")
-        led_frame.pack(side="left", padx=5)
-
-        ctk.CTkLabel(led_frame, text="Status:").pack(side="left", padx=(0, 5))
-        self.status_led = tk.Canvas(led_frame, width=20, height=20, highlightthickness=0, bg="black")
-        self.status_led.pack(side="left")
-        self.led_indicator = self.status_led.create_oval(2, 2, 18, 18, fill="red", outline="darkred")
+        # Children are gridded straight into the frame; transparent wrapper
+        # CTkFrames would each add a canvas and its <Configure> redraws
+        ctk.CTkLabel(frame, text="Status:").grid(row=1, column=0, padx=(10, 5), pady=6)
+        # Both LED states are rendered once; a state change just swaps the image
+        self._led_on = self._make_led_image("green", "darkgreen")
+        self._led_off = self._make_led_image("red", "darkred")
+        self.status_led = tk.Label(frame, image=self._led_off, width=20, height=20, borderwidth=0, bg="black")
+        self.status_led.grid(row=1, column=1, pady=6)
         self._create_tooltip(self.status_led, "Server: Offline")
 
         # Display current server URL as label (edit in Preferences)
-        self.url_display_label = ctk.CTkLabel(content, textvariable=self.base_url_var, text_color="gray")
-        self.url_display_label.pack(side="left", padx=10)
-
-        btn_test = ctk.CTkButton(content, text="Test", command=self.on_test_server, width=70)
-        btn_test.pack(side="left", padx=5)
-
-        self.btn_start_server = ctk.CTkButton(content, text="Start", command=self.on_start_server, width=70)
-        self.btn_start_server.pack(side="left", padx=5)
-
-        self.btn_stop_server = ctk.CTkButton(content, text="Stop", command=self.on_stop_server, width=70, state="disabled")
-        self.btn_stop_server.pack(side="left", padx=5)
+        self.url_display_label = ctk.CTkLabel(frame, textvariable=self.base_url_var, text_color="gray")
+        self.url_display_label.grid(row=1, column=2, padx=10, pady=6)
+
+        btn_test = ctk.CTkButton(frame, text="Test", command=self.on_test_server, width=70)
+        btn_test.grid(row=1, column=3, padx=5, pady=6)
+
+        self.btn_start_server = ctk.CTkButton(frame, text="Start", command=self.on_start_server, width=70)
+        self.btn_start_server.grid(row=1, column=4, padx=5, pady=6)
+
+        self.btn_stop_server = ctk.CTkButton(frame, text="Stop", command=self.on_stop_server, width=70, state="disabled")
+        self.btn_stop_server.grid(row=1, column=5, padx=5, pady=6)
+
+    def _make_led_image(self, fill: str, outline: str, size: int = 20) -> tk.PhotoImage:
+        """Draw a filled circle with a 1px outline into a PhotoImage, one row span per put()."""
+        image = tk.PhotoImage(master=self, width=size, height=size)
+        center = (size - 1) / 2
+        radius = size / 2 - 2
+        for color, r in ((outline, radius), (fill, radius - 1)):
+            for y in range(size):
+                dy = y - center
+                if abs(dy) > r:
+                    continue
+                half = (r * r - dy * dy) ** 0.5
+                x0 = int(round(center - half))
+                x1 = int(round(center + half)) + 1
+                image.put(color, to=(x0, y, x1, y + 1))
+        return image
 
     def _build_pattern_frame(self) -> None:
         frame = ctk.CTkFrame(self)
@@ -1072,70 +1548,53 @@ class FabricGUI(ctk.CTk):
             row=0, column=0, columnspan=6, sticky="w", padx=10, pady=(6, 0)
         )
 
-        search_frame = ctk.CTkFrame(frame, fg_color="transparent")
-        search_frame.grid(row=1, column=0, columnspan=6, sticky="ew", padx=5, pady=(6, 0))
-
-        ctk.CTkLabel(search_frame, text="Search:", width=60, anchor="e").pack(side="left", padx=5)
-        search_entry = ctk.CTkEntry(search_frame, textvariable=self.pattern_search_var, placeholder_text="Filter patterns...", height=36, font=("Segoe UI", 14))
-        search_entry.pack(side="left", padx=5, fill="x", expand=True)
+        # Labels in column 0, stretching inputs in column 1, extras in column 2
+        ctk.CTkLabel(frame, text="Search:", width=60, anchor="e").grid(row=1, column=0, padx=(10, 5), pady=(6, 0))
+        search_entry = ctk.CTkEntry(frame, textvariable=self.pattern_search_var, placeholder_text="Filter patterns...", height=36, font=("Segoe UI", 14))
+        search_entry.grid(row=1, column=1, columnspan=2, sticky="ew", padx=(5, 10), pady=(6, 0))
 
-        row2 = ctk.CTkFrame(frame, fg_color="transparent")
-        row2.grid(row=2, column=0, columnspan=6, sticky="ew", padx=5, pady=6)
+        ctk.CTkLabel(frame, text="Pattern:", width=60, anchor="e").grid(row=2, column=0, padx=(10, 5), pady=6)
 
-        ctk.CTkLabel(row2, text="Pattern:", width=60, anchor="e").pack(side="left", padx=5)
+        self.pattern_combo = ttk.Combobox(frame, textvariable=self.pattern_var, width=45, state="readonly", height=20, font=("Segoe UI", 14))
+        self.pattern_combo.grid(row=2, column=1, sticky="ew", padx=5, pady=6, ipady=6)
 
-        self.pattern_combo = ttk.Combobox(row2, textvariable=self.pattern_var, width=45, state="readonly", height=20, font=("Segoe UI", 14))
-        self.pattern_combo.pack(side="left", padx=5, fill="x", expand=True, ipady=6)
+        btn_refresh = ctk.CTkButton(frame, text="Refresh Patterns", command=self.refresh_patterns)
+        btn_refresh.grid(row=2, column=2, sticky="w", padx=(5, 10), pady=6)
 
-        btn_refresh = ctk.CTkButton(row2, text="Refresh Patterns", command=self.load_patterns)
-        btn_refresh.pack(side="left", padx=5)
+        ctk.CTkLabel(frame, text="Model:", width=60, anchor="e").grid(row=3, column=0, padx=(10, 5), pady=(0, 8))
 
-        model_row = ctk.CTkFrame(frame, fg_color="transparent")
-        model_row.grid(row=3, column=0, columnspan=6, sticky="ew", padx=5, pady=(0, 8))
-
-        ctk.CTkLabel(model_row, text="Model:", width=60, anchor="e").pack(side="left", padx=5)
-
-        self.model_combo = ttk.Combobox(model_row, textvariable=self.model_var, width=45, state="readonly", height=20, font=("Segoe UI", 14))
-        self.model_combo.pack(side="left", padx=5, fill="x", expand=True, ipady=6)
+        self.model_combo = ttk.Combobox(frame, textvariable=self.model_var, width=45, state="readonly", height=20, font=("Segoe UI", 14))
+        self.model_combo.grid(row=3, column=1, sticky="ew", padx=5, pady=(0, 8), ipady=6)
         self.model_combo.bind("<<ComboboxSelected>>", self._on_model_selected)
 
-        self.default_model_label = ctk.CTkLabel(model_row, text="Default: (loading...)", text_color="gray", cursor="hand2")
-        self.default_model_label.pack(side="left", padx=8)
+        self.default_model_label = ctk.CTkLabel(frame, text="Default: (loading...)", text_color="gray", cursor="hand2")
+        self.default_model_label.grid(row=3, column=2, sticky="w", padx=(8, 10), pady=(0, 8))
         self.default_model_label.bind("<Button-1>", lambda e: self.reset_model_selection())
 
-        frame.columnconfigure(0, weight=1)
+        frame.columnconfigure(1, weight=1)
 
     def _build_info_frame(self) -> None:
         frame = ctk.CTkFrame(self)
         frame.pack(fill="x", padx=10, pady=5)
 
-        left = ctk.CTkFrame(frame, fg_color="transparent")
-        left.pack(side="left", fill="x", expand=True, padx=5, pady=6)
-
-        ctk.CTkLabel(left, text="Status", font=FONT_HEADING).pack(anchor="w")
-        self.status_label = ctk.CTkLabel(left, textvariable=self.status_var, font=("Segoe UI", 14, "bold"))
-        self.status_label.pack(fill="x", pady=(2, 0))
+        # Headings on row 0, their widgets on row 1; Status and Command Preview share the slack
+        ctk.CTkLabel(frame, text="Status", font=FONT_HEADING).grid(row=0, column=0, sticky="w", padx=10, pady=(6, 0))
+        self.status_label = ctk.CTkLabel(frame, textvariable=self.status_var, font=("Segoe UI", 14, "bold"))
+        self.status_label.grid(row=1, column=0, sticky="ew", padx=10, pady=(2, 6))
 
-        mid = ctk.CTkFrame(frame, fg_color="transparent")
-        mid.pack(side="left", fill="x", expand=True, padx=5, pady=6)
+        ctk.CTkLabel(frame, text="Command Preview", font=FONT_HEADING).grid(row=0, column=1, sticky="w", padx=5, pady=(6, 0))
+        cmd_entry = ctk.CTkEntry(frame, textvariable=self.command_var, state="readonly", font=FONT_CODE, height=36)
+        cmd_entry.grid(row=1, column=1, sticky="ew", padx=5, pady=(2, 6))
 
-        ctk.CTkLabel(mid, text="Command Preview", font=FONT_HEADING).pack(anchor="w")
-        cmd_entry = ctk.CTkEntry(mid, textvariable=self.command_var, state="readonly", font=FONT_CODE, height=36)
-        cmd_entry.pack(fill="x", pady=(2, 0))
+        ctk.CTkLabel(frame, text="Actions", font=FONT_HEADING).grid(row=0, column=2, columnspan=2, sticky="w", padx=10, pady=(6, 0))
 
-        right = ctk.CTkFrame(frame, fg_color="transparent")
-        right.pack(side="left", padx=5, pady=6)
+        self.btn_cancel = ctk.CTkButton(frame, text="Cancel", command=self.on_cancel, state="disabled")
+        self.btn_cancel.grid(row=1, column=2, padx=(10, 2), pady=(2, 6))
 
-        ctk.CTkLabel(right, text="Actions", font=FONT_HEADING).pack(anchor="w")
+        self.btn_send = ctk.CTkButton(frame, text="Send", command=self.on_send, width=110, fg_color="green", hover_color="darkgreen")
+        self.btn_send.grid(row=1, column=3, padx=(2, 10), pady=(2, 6))
 
-        btns = ctk.CTkFrame(right, fg_color="transparent")
-        btns.pack(fill="x", pady=(2, 0))
-
-        self.btn_cancel = ctk.CTkButton(btns, text="Cancel", command=self.on_cancel, state="disabled")
-        self.btn_cancel.pack(side="left", padx=2)
-
-        self.btn_send = ctk.CTkButton(btns, text="Send", command=self.on_send, width=110, fg_color="green", hover_color="darkgreen")
-        self.btn_send.pack(side="left", padx=2)
+        frame.columnconfigure((0, 1), weight=1)
 
     def _build_io_frame(self) -> None:
         frame = ctk.CTkFrame(self)
@@ -1153,7 +1612,8 @@ class FabricGUI(ctk.CTk):
         ctk.CTkButton(input_toolbar, text="Paste", command=self.paste_input, width=70).pack(side="left", padx=2)
         ctk.CTkButton(input_toolbar, text="Clear", command=self.clear_input, width=70).pack(side="left", padx=2)
 
-        self.input_text = ctk.CTkTextbox(input_frame, wrap="word", font=("Consolas", 14))
+        # Users edit the input, so it gets Ctrl+Z/Ctrl+Y; import_file keeps bulk loads off the stack
+        self.input_text = ctk.CTkTextbox(input_frame, wrap="word", font=("Consolas", 14), undo=True)
         self.input_text.pack(fill="both", expand=True, padx=2, pady=2)
         ContextMenu(self.input_text._textbox)
 
@@ -1178,7 +1638,8 @@ class FabricGUI(ctk.CTk):
         self.btn_history_next = ctk.CTkButton(output_toolbar, text=">", command=self.history_next, width=36)
         self.btn_history_next.pack(side="left", padx=2)
 
-        self.output_text = ctk.CTkTextbox(output_frame, wrap="word", font=("Consolas", 14))
+        # Output is program-written only; no undo stack to snapshot every streamed insert into
+        self.output_text = ctk.CTkTextbox(output_frame, wrap="word", font=("Consolas", 14), undo=False, maxundo=0)
         self.output_text.pack(fill="both", expand=True, padx=2, pady=2)
         self.output_text.configure(state="disabled")
         ContextMenu(self.output_text._textbox)
@@ -1200,25 +1661,37 @@ class FabricGUI(ctk.CTk):
     def _create_tooltip(self, widget, text: str) -> None:
         widget.tooltip_text = text
 
-        def on_enter(event):
+        def show(x_root: int, y_root: int):
+            self._tooltip_after = None
             t = getattr(widget, "tooltip_text", "")
             if not t:
                 return
-            tip = tk.Toplevel()
-            tip.wm_overrideredirect(True)
-            tip.wm_geometry(f"+{event.x_root+10}+{event.y_root+10}")
-            label = tk.Label(tip, text=t, background="lightyellow", relief="solid", borderwidth=1)
-            label.pack()
-            widget._tooltip = tip
+            # One withdrawn Toplevel is reused for every tooltip
+            if self._tooltip_win is None:
+                self._tooltip_win = tk.Toplevel(self)
+                self._tooltip_win.withdraw()
+                self._tooltip_win.wm_overrideredirect(True)
+                self._tooltip_label = tk.Label(self._tooltip_win, background="lightyellow", relief="solid", borderwidth=1)
+                self._tooltip_label.pack()
+            self._tooltip_label.configure(text=t)
+            self._tooltip_win.wm_geometry(f"+{x_root+10}+{y_root+10}")
+            self._tooltip_win.deiconify()
+
+        def on_enter(event):
+            # Only show after the pointer dwells; fly-throughs cost one after() call
+            if self._tooltip_after:
+                self.after_cancel(self._tooltip_after)
+            self._tooltip_after = self.after(TOOLTIP_DELAY_MS, show, event.x_root, event.y_root)
 
         def on_leave(event):
-            tip = getattr(widget, "_tooltip", None)
-            if tip:
+            if self._tooltip_after:
+                self.after_cancel(self._tooltip_after)
+                self._tooltip_after = None
+            if self._tooltip_win is not None:
                 try:
-                    tip.destroy()
+                    self._tooltip_win.withdraw()
                 except Exception:
                     pass
-                widget._tooltip = None
 
         widget.bind("<Enter>", on_enter)
         widget.bind("<Leave>", on_leave)
@@ -1231,16 +1704,23 @@ class FabricGUI(ctk.CTk):
     # -----------------------------
 
     def _normalize_base_url_from_entry(self) -> str:
-        url = (self.base_url_var.get() or "").strip()
+        raw = self.base_url_var.get() or ""
+        # Called before every request and lookup; skip re-validation while unchanged
+        if raw and raw == self._normalized_base_url:
+            return raw
+        url = raw.strip()
         if not url:
             raise ValueError("Base URL cannot be empty")
         if not url.startswith(("http://", "https://")):
             raise ValueError("Base URL must start with http:// or https://")
-        if any(c in url for c in [" ", "\n", "\r", "\t"]):
+        if _URL_WS_RE.search(url):
             raise ValueError("Base URL cannot contain whitespace")
         if url.endswith("/"):
             url = url[:-1]
-        self.base_url_var.set(url)
+        # Writing the variable redraws the URL label; only do it when normalizing changed something
+        if url != raw:
+            self.base_url_var.set(url)
+        self._normalized_base_url = url
         return url
 
     def _sync_server_manager_from_ui(self) -> None:
@@ -1251,43 +1731,112 @@ class FabricGUI(ctk.CTk):
         # Always persist corrected flag
         if self.app_config.get("port_flag", "").strip() == "--port":
             self.app_config["port_flag"] = "--address"
-
-        self.app_config["base_url"] = self.base_url_var.get().strip()
-        self.app_config["last_pattern"] = self.pattern_var.get()
-        self.app_config["last_model"] = (self.model_var.get().strip() if self.model_var.get().startswith("  ") else "")
-        self.app_config["window_geometry"] = self.geometry()
-        self.app_config["fabric_command"] = self.app_config.get("fabric_command", "fabric")
-        self.app_config["port_flag"] = self.app_config.get("port_flag", "--address")
-        ConfigManager.save(self.app_config)
+            self._config_dirty = True
+
+        model_selection = self.model_var.get()
+        updates = {
+            "base_url": self.base_url_var.get().strip(),
+            "last_pattern": self.pattern_var.get().strip(),
+            "last_model": (model_selection.strip() if model_selection.startswith("  ") else ""),
+            "window_geometry": self.geometry(),
+            "fabric_command": self.app_config.get("fabric_command", "fabric"),
+            "port_flag": self.app_config.get("port_flag", "--address"),
+        }
+        # Only mark dirty when a value actually changed, so a plain exit writes nothing
+        if any(self.app_config.get(k) != v for k, v in updates.items()):
+            self.app_config.update(updates)
+            self._queue_config_save()
 
         # Keep runtime manager in sync with persisted flag too
         self.server_manager.port_flag = self.app_config["port_flag"]
 
+    def _queue_config_save(self) -> None:
+        """Mark the config dirty and write it once the UI has been idle for a moment."""
+        self._config_dirty = True
+        if self._config_save_after_id:
+            self.after_cancel(self._config_save_after_id)
+        self._config_save_after_id = self.after(CONFIG_SAVE_DELAY_MS, self._flush_config)
+
+    def _flush_config(self) -> None:
+        self._config_save_after_id = None
+        if not self._config_dirty:
+            return
+        self._config_dirty = False
+        self._config_executor.submit(ConfigManager.save, dict(self.app_config))
+
     def _set_status(self, text: str) -> None:
         self.status_var.set(text)
-        self.update_idletasks()
-        logger.info(f"Status: {text}")
+        _log_info("Status: %s", text)
 
     def _set_output_text(self, text: str) -> None:
         self.output_text.configure(state="normal")
         self.output_text.delete("1.0", "end")
         self.output_text.insert("1.0", text)
-        self.output_text.configure(state="disabled")
+        if not self._output_streaming:
+            self.output_text.configure(state="disabled")
 
     def _append_output_text(self, text: str) -> None:
+        # While streaming the widget is already writable (see _set_output_streaming)
+        if self._output_streaming:
+            self.output_text.insert("end", text)
+            self.output_text.see("end")
+            return
         self.output_text.configure(state="normal")
         self.output_text.insert("end", text)
         self.output_text.see("end")
         self.output_text.configure(state="disabled")
 
+    def _set_output_streaming(self, streaming: bool) -> None:
+        """Keep the output box writable for the whole request instead of toggling
+        its state around every append; user edits are blocked by bindings."""
+        if streaming == self._output_streaming:
+            return
+        self._output_streaming = streaming
+        textbox = self.output_text._textbox
+        if streaming:
+            # Word wrapping is recomputed on every insert; wrap once at the end instead
+            self.output_text.configure(state="normal", wrap="none")
+            textbox.bind("<Key>", self._block_output_edit)
+            for seq in ("<<Paste>>", "<<Cut>>", "<<PasteSelection>>"):
+                textbox.bind(seq, lambda e: "break")
+        else:
+            for seq in ("<Key>", "<<Paste>>", "<<Cut>>", "<<PasteSelection>>"):
+                textbox.unbind(seq)
+            self.output_text.configure(state="disabled", wrap="word")
+
+    @staticmethod
+    def _block_output_edit(event) -> Optional[str]:
+        # Let navigation and Ctrl shortcuts (copy, select all) through
+        if event.keysym in ("BackSpace", "Delete", "Return", "KP_Enter", "Tab"):
+            return "break"
+        if event.char and not (event.state & 0x4):
+            return "break"
+        return None
+
     def _set_ui_processing(self, processing: bool) -> None:
         self.btn_send.configure(state="disabled" if processing else "normal")
         self.btn_cancel.configure(state="normal" if processing else "disabled")
         
         if processing:
+            self._set_output_streaming(True)
             self._start_progress_animation()
         else:
             self._stop_progress_animation()
+            self._drain_output()
+            self._set_output_streaming(False)
+
+    def _drain_output(self) -> None:
+        """Append everything queued by the worker with a single widget update."""
+        # Clear the flag first: anything queued after this point arms a new drain
+        self._drain_scheduled = False
+        parts: List[str] = []
+        try:
+            while True:
+                parts.append(self._out_queue.get_nowait())
+        except queue.Empty:
+            pass
+        if parts:
+            self._append_output_text("".join(parts))
 
     def _start_progress_animation(self) -> None:
         """Start the animated processing indicator."""
@@ -1310,7 +1859,12 @@ class FabricGUI(ctk.CTk):
         """Animate the processing status with pulsing dots and color."""
         if not hasattr(self, 'status_label'):
             return
-            
+
+        # Minimized or hidden: keep the timer alive but skip the widget updates
+        if not self.winfo_viewable():
+            self._progress_animation_id = self.after(300, self._animate_progress)
+            return
+
         # Update dots: Processing. -> Processing.. -> Processing... -> Processing
         self._progress_dot_count = (self._progress_dot_count + 1) % 4
         dots = "." * self._progress_dot_count if self._progress_dot_count > 0 else ""
@@ -1339,8 +1893,16 @@ class FabricGUI(ctk.CTk):
         try:
             self._sync_server_manager_from_ui()
             self._save_config_from_ui()
+        except Exception as e:
+            messagebox.showerror("Error", str(e))
+            return
+        self._set_status("Testing connection...")
+        self._run_in_background(self.server_manager.check_health, self._on_test_server_done)
 
-            ok = self.server_manager.check_health()
+    def _on_test_server_done(self, future: concurrent.futures.Future) -> None:
+        try:
+            ok = future.result()
+            self._set_status("Server reachable" if ok else "Server unreachable")
             if ok:
                 messagebox.showinfo("Success", "Connected to Fabric server successfully.")
                 self._on_server_status_change(True)
@@ -1350,40 +1912,95 @@ class FabricGUI(ctk.CTk):
         except Exception as e:
             messagebox.showerror("Error", str(e))
 
-    def on_start_server(self) -> None:
+    def on_start_server(self, on_started: Optional[Callable[[], None]] = None) -> None:
         try:
             self.btn_start_server.configure(state="disabled")
             self._sync_server_manager_from_ui()
             self._save_config_from_ui()
-
-            self._set_status("Starting server...")
-            success = self.server_manager.start_server()
-            if not success:
-                self._set_status("Failed to start server")
-
-                tail = "\n".join(self.server_manager.last_server_lines[-20:])
-                if tail.strip():
-                    messagebox.showerror("Fabric server failed to start", f"Fabric exited immediately.\n\nLast output:\n{tail}")
-                else:
-                    messagebox.showerror("Fabric server failed to start", "Fabric exited immediately.\n\nNo output captured. Check logs.")
-                self.btn_start_server.configure(state="normal")
-                return
-
-            self.after(800, self.load_patterns)
-            self._set_status("Server started")
-            self.btn_stop_server.configure(state="normal")
-
         except Exception as e:
             logger.error(f"Start server error: {e}")
             self._set_status("Error starting server")
             messagebox.showerror("Error", str(e))
             self.btn_start_server.configure(state="normal")
+            return
+
+        if not self.server_manager.server_exited():
+            # A previous start is still booting (or running without answering yet)
+            self._set_status("Server is already running")
+            self.btn_stop_server.configure(state="normal")
+            return
+
+        self._set_status("Starting server...")
+        self._server_starting = True
+        if not self.server_manager.start_server():
+            self._on_server_start_failed()
+            return
+        # Launching is quick; readiness is polled with after() so the GUI stays live
+        self._wait_for_server(time.monotonic() + SERVER_START_WAIT, SERVER_START_PROBE_MS, on_started)
+
+    def _wait_for_server(self, deadline: float, delay_ms: int, on_started: Optional[Callable[[], None]]) -> None:
+        if self._shutting_down:
+            return
+        if self.server_manager.server_exited():
+            logger.error("Server process terminated immediately")
+            self._on_server_start_failed()
+            return
+        if time.monotonic() >= deadline:
+            # Still running but not answering yet; health polling takes over from here.
+            # Not a success: a deferred send is dropped rather than run against a dead port
+            logger.warning("Server not answering after %.0fs; leaving it to health polling", SERVER_START_WAIT)
+            self._server_starting = False
+            self._set_status("Server still starting...")
+            self.btn_stop_server.configure(state="normal")
+            return
+        self._run_in_background(
+            self.server_manager.probe_ready,
+            functools.partial(self._on_start_probe, deadline, delay_ms, on_started),
+        )
+
+    def _on_start_probe(self, deadline: float, delay_ms: int, on_started: Optional[Callable[[], None]], future: concurrent.futures.Future) -> None:
+        try:
+            ready = future.result()
+        except Exception:
+            ready = False
+        if ready:
+            self._on_server_start_succeeded(on_started)
+        else:
+            next_delay = min(delay_ms * 2, SERVER_START_PROBE_MAX_MS)
+            self.after(delay_ms, self._wait_for_server, deadline, next_delay, on_started)
+
+    def _on_server_start_succeeded(self, on_started: Optional[Callable[[], None]]) -> None:
+        self._server_starting = False
+        self.server_manager.invalidate_patterns()
+        self.after(800, self.load_patterns)
+        self._set_status("Server started")
+        self.btn_stop_server.configure(state="normal")
+        if on_started:
+            on_started()
+
+    def _on_server_start_failed(self) -> None:
+        self._server_starting = False
+        self._set_status("Failed to start server")
+
+        tail = "\n".join(list(self.server_manager.last_server_lines)[-20:])
+        if tail.strip():
+            messagebox.showerror("Fabric server failed to start", f"Fabric exited immediately.\n\nLast output:\n{tail}")
+        else:
+            messagebox.showerror("Fabric server failed to start", "Fabric exited immediately.\n\nNo output captured. Check logs.")
+        self.btn_start_server.configure(state="normal")
 
     def on_stop_server(self) -> None:
         if not messagebox.askyesno("Confirm", "Stop the Fabric server?"):
             return
         self._set_status("Stopping server...")
-        ok = self.server_manager.stop_server()
+        self.btn_stop_server.configure(state="disabled")
+        self._run_in_background(self.server_manager.stop_server, self._on_server_stopped)
+
+    def _on_server_stopped(self, future: concurrent.futures.Future) -> None:
+        try:
+            ok = future.result()
+        except Exception:
+            ok = False
         if ok:
             self._set_status("Server stopped")
             self._on_server_status_change(False)
@@ -1392,54 +2009,148 @@ class FabricGUI(ctk.CTk):
             messagebox.showerror("Error", "Failed to stop server. Check logs.")
             self.btn_stop_server.configure(state="normal")
 
+    def _run_in_background(self, func: Callable[..., Any], on_done: Callable[[concurrent.futures.Future], None], *args: Any) -> concurrent.futures.Future:
+        """Run a blocking call on the executor and pass its future to on_done on the Tk thread."""
+        future = self._executor.submit(func, *args)
+
+        def _done(f: concurrent.futures.Future) -> None:
+            # Runs on the executor thread; hand the result back to the Tk loop
+            if self._shutting_down:
+                return
+            try:
+                self.after(0, on_done, f)
+            except Exception as e:
+                logger.error(f"Failed to deliver background result to the UI: {e}")
+
+        future.add_done_callback(_done)
+        return future
+
+    def _health_tick(self) -> None:
+        self._health_after_id = None
+        if self._shutting_down:
+            return
+        # Watchdog first: if the result below is lost on its way back, polling still continues
+        self._health_after_id = self.after(HEALTH_WATCHDOG_MS, self._health_tick)
+        # A probe stuck behind slow lookups is still pending; don't queue another behind it
+        if self._health_future is not None and not self._health_future.done():
+            return
+        self._health_future = self._run_in_background(self.server_manager.check_health, self._apply_health)
+
+    def _apply_health(self, future: concurrent.futures.Future) -> None:
+        if self._shutting_down:
+            return
+        try:
+            online = future.result()
+        except Exception:
+            online = False
+        self._update_led_status(online)
+        # Replace the watchdog with the regular next tick
+        if self._health_after_id:
+            self.after_cancel(self._health_after_id)
+        delay = self.server_manager.next_health_delay(online, self._health_interval)
+        self._health_after_id = self.after(int(delay * 1000), self._health_tick)
+
     def _on_server_status_change(self, is_online: bool) -> None:
+        if self._shutting_down:
+            return
         self.after(0, lambda: self._update_led_status(is_online))
 
     def _update_led_status(self, is_online: bool) -> None:
+        # Start/Stop are also toggled by the start/stop paths, so re-assert them here,
+        # except while a start is in progress and its own path owns the buttons
+        if not self._server_starting:
+            if is_online:
+                self.btn_start_server.configure(state="disabled")
+                self.btn_stop_server.configure(state="normal")
+            else:
+                self.btn_start_server.configure(state="normal")
+                self.btn_stop_server.configure(state="disabled")
+
+        # Every health probe lands here; only redraw the LED and tooltip on a real change
+        state = (is_online, self.server_manager.base_url)
+        if state == self._led_state:
+            return
+        self._led_state = state
+
+        # Log transitions, rate-limited so a flapping server doesn't spam the log
+        now = time.monotonic()
+        if is_online != self._last_logged_online and now - self._last_status_log_ts >= STATUS_LOG_MIN_INTERVAL:
+            self._last_logged_online = is_online
+            self._last_status_log_ts = now
+            _log_info("Server status changed: %s", "online" if is_online else "offline")
+
         if is_online:
-            self.status_led.itemconfig(self.led_indicator, fill="green", outline="darkgreen")
+            self.status_led.configure(image=self._led_on)
             self._update_tooltip_text(self.status_led, f"Server: Online ({self.server_manager.base_url})")
-            self.btn_start_server.configure(state="disabled")
-            self.btn_stop_server.configure(state="normal")
         else:
-            self.status_led.itemconfig(self.led_indicator, fill="red", outline="darkred")
+            self.status_led.configure(image=self._led_off)
             self._update_tooltip_text(self.status_led, f"Server: Offline ({self.server_manager.base_url})")
-            self.btn_start_server.configure(state="normal")
-            self.btn_stop_server.configure(state="disabled")
 
     # -----------------------------
     # Patterns / Models
     # -----------------------------
 
+    def _set_pattern_values(self, values: Sequence[str]) -> None:
+        self._combo_values = values
+        self.pattern_combo.configure(values=values)
+
+    def _schedule_filter(self, *args) -> None:
+        if self._filter_after:
+            self.after_cancel(self._filter_after)
+        self._filter_after = self.after(UI_DEBOUNCE_MS, self._filter_patterns)
+
     def _filter_patterns(self, *args) -> None:
+        self._filter_after = None
         if not self.all_patterns:
             return
         needle = (self.pattern_search_var.get() or "").strip().lower()
+        # Reconfiguring the combobox rebuilds its listbox; skip when nothing changed
+        # (e.g. only surrounding whitespace or letter case was edited)
+        if needle == self._last_filter_needle:
+            return
+        self._last_filter_needle = needle
         if not needle:
-            self.pattern_combo.configure(values=self.all_patterns)
+            self._set_pattern_values(self.all_patterns)
             return
-        filtered = [p for p in self.all_patterns if needle in p.lower()]
-        self.pattern_combo.configure(values=filtered if filtered else ["No matches found"])
+        filtered = [p for p, pl in zip(self.all_patterns, self._patterns_lower) if needle in pl]
+        self._set_pattern_values(filtered if filtered else ["No matches found"])
+
+    def refresh_patterns(self) -> None:
+        """Reload patterns from the server, bypassing the cache."""
+        self.server_manager.invalidate_patterns()
+        self.load_patterns()
 
     def load_patterns(self) -> None:
         try:
             self._sync_server_manager_from_ui()
-            patterns = self.server_manager.get_patterns()
+        except Exception as e:
+            logger.error(f"Error loading patterns: {e}")
+            self._set_pattern_values(["Error loading patterns"])
+            return
+        self._run_in_background(self.server_manager.get_patterns, self._apply_patterns)
+
+    def _apply_patterns(self, future: concurrent.futures.Future) -> None:
+        try:
+            patterns = future.result()
             if patterns is None:
                 self.all_patterns = []
-                self.pattern_combo.configure(values=["Server Offline / Error"])
+                self._patterns_lower = []
+                self._set_pattern_values(["Server Offline / Error"])
                 return
 
             if not patterns:
                 self.all_patterns = []
-                self.pattern_combo.configure(values=["No patterns found"])
+                self._patterns_lower = []
+                self._set_pattern_values(["No patterns found"])
                 return
 
             self.all_patterns = patterns
+            self._patterns_lower = [p.lower() for p in patterns]
+            self._last_filter_needle = None
             self._filter_patterns()
 
             last = self.app_config.get("last_pattern", "")
-            values = list(self.pattern_combo.cget("values") or [])
+            values = self._combo_values
             if last and last in values:
                 self.pattern_var.set(last)
             elif values and values[0] not in ("No matches found", "No patterns found", "Server Offline / Error"):
@@ -1448,24 +2159,50 @@ class FabricGUI(ctk.CTk):
 
         except Exception as e:
             logger.error(f"Error loading patterns: {e}")
-            self.pattern_combo.configure(values=["Error loading patterns"])
+            self._set_pattern_values(["Error loading patterns"])
+
+    def _apply_cached_patterns(self, future: concurrent.futures.Future) -> None:
+        try:
+            patterns = future.result()
+        except Exception:
+            return
+        # The live list may already have arrived; never overwrite it with the saved one
+        if patterns and not self.all_patterns:
+            self._apply_patterns(future)
 
     def load_models(self) -> None:
+        # Both calls may spawn or read from disk, so keep them off the Tk thread
+        def _fetch() -> tuple:
+            return self.server_manager.get_models(), self.server_manager.get_default_model()
+
+        self._run_in_background(_fetch, self._apply_models)
+
+    def _apply_models(self, future: concurrent.futures.Future) -> None:
         try:
-            models_by_provider = self.server_manager.get_models()
+            models_by_provider, default_model = future.result()
             if not models_by_provider:
+                self._models_cache_key = None
                 self.model_combo.configure(values=["Error loading models"])
                 return
 
-            display: List[str] = []
+            # Provider headers followed by their indented models, filled into a
+            # list allocated at its final size
+            total = sum(1 + len(ms) for ms in models_by_provider.values())
+            display: List[str] = [""] * total
+            i = 0
             for provider, models in models_by_provider.items():
-                display.append(provider)
+                display[i] = provider
+                i += 1
                 for m in models:
-                    display.append(f"  {m}")
+                    display[i] = "  " + m
+                    i += 1
 
-            self.model_combo.configure(values=display)
+            # Reconfiguring the combobox rebuilds its listbox; only do it on change
+            key = tuple((p, tuple(ms)) for p, ms in models_by_provider.items())
+            if key != self._models_cache_key:
+                self._models_cache_key = key
+                self.model_combo.configure(values=display)
 
-            default_model = self.server_manager.get_default_model()
             if default_model:
                 self.default_model_label.configure(text=f"Default: {default_model}")
             else:
@@ -1494,12 +2231,27 @@ class FabricGUI(ctk.CTk):
         self._update_command_preview()
         self._set_status("Model reset to default")
 
+    def _schedule_command_preview(self, *args) -> None:
+        # Coalesce all writes in one event into a single update at the next idle
+        # point; the preview needs no typing delay, only deduplication
+        if self._preview_after:
+            return
+        self._preview_after = self.after_idle(self._update_command_preview)
+
     def _update_command_preview(self, *args) -> None:
+        self._preview_after = None
         cmd = self.app_config.get("fabric_command", "fabric")
         pattern = self.pattern_var.get().strip()
+        model_sel = self.model_var.get()
+
+        # Setting command_var refreshes the entry; skip it when nothing changed
+        key = (cmd, pattern, model_sel)
+        if key == self._last_cmd_key:
+            return
+        self._last_cmd_key = key
+
         if pattern:
             cmd += f" -p {pattern}"
-        model_sel = self.model_var.get()
         if model_sel and model_sel.startswith("  "):
             cmd += f" -m {model_sel.strip()}"
         self.command_var.set(cmd)
@@ -1514,6 +2266,14 @@ class FabricGUI(ctk.CTk):
             messagebox.showwarning("Warning", "Please enter some text to process.")
             return
 
+        # Tk variables are read here on the Tk thread, once, and handed to the worker
+        pattern = self.pattern_var.get().strip()
+        if not pattern:
+            messagebox.showwarning("Warning", "Please select a pattern.")
+            return
+        model_selection = self.model_var.get()
+        model = model_selection.strip() if model_selection.startswith("  ") else ""
+
         try:
             self._sync_server_manager_from_ui()
             self._save_config_from_ui()
@@ -1523,139 +2283,136 @@ class FabricGUI(ctk.CTk):
 
         if not self.server_manager.is_running():
             if messagebox.askyesno("Server Offline", "Fabric server appears offline. Start it now?"):
-                self.on_start_server()
-                self.after(1500, lambda: self.on_send(event))
+                self.on_start_server(on_started=lambda: self.on_send(event))
             return
 
         self._set_ui_processing(True)
         self.status_var.set("Processing...")
         self._set_output_text("")
 
-        self.history.add(self.pattern_var.get(), input_text, "")
+        entry = self.history.add(pattern, input_text, "")
 
         self.cancel_request = False
-        self.current_request_thread = threading.Thread(target=self._process_request, args=(input_text,), daemon=True)
-        self.current_request_thread.start()
+        self.current_request = self._async.submit(self._process_request(input_text, pattern, model, entry))
 
     def on_cancel(self) -> None:
-        if self.current_request_thread and self.current_request_thread.is_alive():
+        if self.current_request and not self.current_request.done():
             self.cancel_request = True
             self.status_var.set("Cancelling...")
             self.btn_cancel.configure(state="disabled")
-            try:
-                if self.current_process and self.current_process.poll() is None:
-                    self.current_process.terminate()
-            except Exception:
-                pass
+            self._async.call_soon(self._terminate_current_process)
 
-    def _should_filter_line(self, line: str) -> bool:
-        if "Ollama Get" in line and "connectex" in line:
-            return True
-        return False
-
-    def _process_request(self, input_text: str) -> None:
+    def _terminate_current_process(self) -> None:
+        # Runs on the async worker loop
         try:
-            pattern = self.pattern_var.get().strip()
-            if not pattern:
-                self.after(0, lambda: messagebox.showwarning("Warning", "Please select a pattern."))
-                self.after(0, lambda: self._set_ui_processing(False))
-                return
-
-            self.app_config["last_pattern"] = pattern
-            model_selection = self.model_var.get()
-            if model_selection and model_selection.startswith("  "):
-                self.app_config["last_model"] = model_selection.strip()
-            else:
-                self.app_config["last_model"] = ""
-
-            self._save_config_from_ui()
+            if self.current_process and self.current_process.returncode is None:
+                self.current_process.terminate()
+        except Exception:
+            pass
 
+    def _should_filter_line(self, line: str) -> bool:
+        return _FILTER_RE.search(line) is not None
+
+    def _emit_output(self, text: str, output: io.StringIO) -> None:
+        """Queue a decoded block of whole lines for display, minus filtered lines."""
+        text = text.replace("\r\n", "\n")
+        # One regex scan over the whole block; only rewrite it when something matches
+        if self._should_filter_line(text):
+            text = _FILTER_LINE_RE.sub("", text)
+        if text:
+            output.write(text)
+            self._out_queue.put(text)
+            # One drain per OUTPUT_DRAIN_MS window, armed only when output is
+            # waiting, so a model that is still thinking costs no timer wakeups
+            if not self._drain_scheduled:
+                self._drain_scheduled = True
+                self.after(OUTPUT_DRAIN_MS, self._drain_output)
+
+    async def _process_request(self, input_text: str, pattern: str, model: str, history_entry: Dict[str, str]) -> None:
+        # Runs on the async worker: pattern and model were read from the Tk variables
+        # by on_send, whose _save_config_from_ui() call already recorded them
+        process: Optional[asyncio.subprocess.Process] = None
+        try:
             fabric_cmd = self.app_config.get("fabric_command", "fabric")
             cmd = [fabric_cmd, "-p", pattern]
-            if model_selection and model_selection.startswith("  "):
-                cmd.extend(["-m", model_selection.strip()])
+            if model:
+                cmd.extend(["-m", model])
 
-            env = os.environ.copy()
-            env["PYTHONUNBUFFERED"] = "1"
+            # Copy the environment once and reuse it for every request
+            if self._request_env is None:
+                env = os.environ.copy()
+                env["PYTHONUNBUFFERED"] = "1"
+                self._request_env = env
 
             creationflags = 0
             if os.name == "nt":
                 creationflags = subprocess.CREATE_NO_WINDOW
 
-            process = subprocess.Popen(
-                cmd,
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
                 stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=False,
-                bufsize=0,
-                env=env,
+                env=self._request_env,
                 creationflags=creationflags,
             )
             self.current_process = process
 
-            def _write_input():
+            async def _write_input():
                 try:
-                    if process.stdin:
-                        process.stdin.write(input_text.encode("utf-8"))
-                        process.stdin.flush()
-                        process.stdin.close()
+                    process.stdin.write(input_text.encode("utf-8"))
+                    await process.stdin.drain()
                 except Exception as e:
                     logger.error(f"Error writing stdin: {e}")
-
-            threading.Thread(target=_write_input, daemon=True).start()
-
-            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
-
-            full_output = ""
-            line_buffer = ""
-
-            while True:
-                if self.cancel_request:
+                finally:
+                    process.stdin.close()
+
+            # Feed stdin concurrently with reading stdout so neither pipe can fill up
+            writer = asyncio.ensure_future(_write_input())
+            # Full response for the history entry, written as it streams in
+            output = io.StringIO()
+
+            # Read whatever is available in large chunks and decode only up to the
+            # last complete line, so each chunk costs one decode and one queue put
+            buf = bytearray()
+            # Bound once; the loop runs per chunk for the whole response
+            read = process.stdout.read
+            emit = self._emit_output
+            while not self.cancel_request:
+                chunk = await read(OUTPUT_READ_SIZE)
+                if not chunk:
                     break
+                buf += chunk
+                idx = buf.rfind(b"\n")
+                if idx < 0:
+                    continue
+                # Decode straight out of the buffer; slicing the bytearray would copy it first
+                with memoryview(buf) as view:
+                    text = str(view[: idx + 1], "utf-8", "replace")
+                del buf[: idx + 1]
+                emit(text, output)
 
-                chunk = b""
-                try:
-                    if process.stdout:
-                        chunk = process.stdout.read(CHUNK_SIZE)
-                except Exception:
-                    chunk = b""
-
-                if not chunk and process.poll() is not None:
-                    break
-
-                if chunk:
-                    text = decoder.decode(chunk, final=False)
-                    if not text:
-                        continue
-
-                    line_buffer += text
-                    while "\n" in line_buffer:
-                        line, line_buffer = line_buffer.split("\n", 1)
-                        line = line + "\n"
-                        if self._should_filter_line(line):
-                            continue
-                        full_output += line
-                        self.after(0, self._append_output_text, line)
-
-            remaining = decoder.decode(b"", final=True)
-            if remaining:
-                line_buffer += remaining
+            if buf and not self.cancel_request:
+                self._emit_output(buf.decode("utf-8", "replace"), output)
 
-            if line_buffer and not self._should_filter_line(line_buffer):
-                full_output += line_buffer
-                self.after(0, self._append_output_text, line_buffer)
+            if self.cancel_request:
+                writer.cancel()
+            await asyncio.gather(writer, return_exceptions=True)
+            full_output = output.getvalue()
 
             if self.cancel_request:
                 self.after(0, lambda: self.status_var.set("Cancelled"))
             else:
-                rc = process.poll()
+                try:
+                    rc = await asyncio.wait_for(process.wait(), timeout=2)
+                except asyncio.TimeoutError:
+                    rc = None
                 if rc and rc != 0:
                     self.after(0, lambda: self.status_var.set(f"Completed (error code {rc})"))
                 else:
                     self.after(0, lambda: self.status_var.set("Completed"))
 
-            self.history.update_current_output(full_output)
+            self.history.set_output(history_entry, full_output)
 
         except Exception as e:
             logger.error(f"Processing error: {e}")
@@ -1663,24 +2420,13 @@ class FabricGUI(ctk.CTk):
             self.after(0, lambda: self.status_var.set("Error"))
         finally:
             try:
-                if self.current_process and self.current_process.poll() is None:
-                    self.current_process.terminate()
+                if process and process.returncode is None:
+                    process.terminate()
                     try:
-                        self.current_process.wait(timeout=2)
-                    except subprocess.TimeoutExpired:
-                        self.current_process.kill()
-                        self.current_process.wait(timeout=2)
-            except Exception:
-                pass
-
-            try:
-                if self.current_process and self.current_process.stdout:
-                    self.current_process.stdout.close()
-            except Exception:
-                pass
-            try:
-                if self.current_process and self.current_process.stdin:
-                    self.current_process.stdin.close()
+                        await asyncio.wait_for(process.wait(), timeout=2)
+                    except asyncio.TimeoutError:
+                        process.kill()
+                        await asyncio.wait_for(process.wait(), timeout=2)
             except Exception:
                 pass
 
@@ -1697,6 +2443,8 @@ class FabricGUI(ctk.CTk):
             messagebox.showinfo("Info", "No output to save.")
             return
 
+        from tkinter import filedialog
+
         file_path = filedialog.asksaveasfilename(
             defaultextension=".md",
             filetypes=[("Markdown files", "*.md"), ("Text files", "*.txt"), ("All files", "*.*")],
@@ -1705,7 +2453,10 @@ class FabricGUI(ctk.CTk):
             return
 
         try:
-            Path(file_path).write_text(text, encoding="utf-8")
+            # Write in slices so only one chunk is ever held in encoded form
+            with open(file_path, "w", encoding="utf-8") as f:
+                for i in range(0, len(text), SAVE_WRITE_CHUNK_CHARS):
+                    f.write(text[i : i + SAVE_WRITE_CHUNK_CHARS])
             self.status_var.set(f"Saved to {Path(file_path).name}")
         except Exception as e:
             logger.error(f"Error saving file: {e}")
@@ -1735,6 +2486,8 @@ class FabricGUI(ctk.CTk):
 
     def import_file(self) -> None:
         """Import text from a .txt or .md file into the input box."""
+        from tkinter import filedialog
+
         file_path = filedialog.askopenfilename(
             title="Import Text File",
             filetypes=[
@@ -1748,12 +2501,19 @@ class FabricGUI(ctk.CTk):
             return
         
         try:
-            with open(file_path, "r", encoding="utf-8", errors="replace") as f:
-                content = f.read()
-            
-            # Clear existing content and insert new
-            self.input_text.delete("1.0", "end")
-            self.input_text.insert("1.0", content)
+            content = Path(file_path).read_text(encoding="utf-8", errors="replace")
+
+            # Clear existing content and insert new without recording either
+            # (potentially huge) edit on the undo stack
+            text_widget = self.input_text._textbox
+            text_widget.configure(undo=False)
+            try:
+                text_widget.delete("1.0", "end")
+                text_widget.insert("1.0", content)
+            finally:
+                text_widget.configure(undo=True)
+                # Earlier edits refer to text that is gone; start a fresh history
+                text_widget.edit_reset()
             
             # Show filename in status
             filename = Path(file_path).name
@@ -1776,15 +2536,28 @@ class FabricGUI(ctk.CTk):
         self.input_text.insert("1.0", entry.get("input", ""))
         self._set_output_text(entry.get("output", ""))
         pat = entry.get("pattern", "")
-        if pat and pat in (self.pattern_combo.cget("values") or []):
+        if pat and pat in self._combo_values:
             self.pattern_var.set(pat)
         self._update_history_buttons()
 
     def history_previous(self) -> None:
-        self._load_history_entry(self.history.previous())
+        self._queue_history_nav(self.history.previous())
 
     def history_next(self) -> None:
-        self._load_history_entry(self.history.next())
+        self._queue_history_nav(self.history.next())
+
+    def _queue_history_nav(self, entry: Optional[Dict[str, str]]) -> None:
+        # The cursor moves immediately; only the final entry of a burst is rendered
+        if entry is not None:
+            self._history_nav_pending = entry
+        if self._history_nav_after_id:
+            self.after_cancel(self._history_nav_after_id)
+        self._history_nav_after_id = self.after(HISTORY_NAV_DEBOUNCE_MS, self._flush_history_nav)
+
+    def _flush_history_nav(self) -> None:
+        self._history_nav_after_id = None
+        entry, self._history_nav_pending = self._history_nav_pending, None
+        self._load_history_entry(entry)
 
     # -----------------------------
     # Preferences
@@ -1798,7 +2571,11 @@ class FabricGUI(ctk.CTk):
         if dialog.result:
             # Update config
             self.app_config.update(dialog.result)
-            ConfigManager.save(self.app_config)
+            # Write now through the ordered config worker; this supersedes any pending debounced save
+            if self._config_save_after_id:
+                self.after_cancel(self._config_save_after_id)
+            self._config_dirty = True
+            self._flush_config()
             
             # Apply changes to running application
             self._apply_preferences_changes(dialog.result)
@@ -1818,7 +2595,8 @@ class FabricGUI(ctk.CTk):
         # Update server manager settings
         self.server_manager.fabric_command = new_settings.get("fabric_command", "fabric")
         
-        # Note: health_check_interval changes will take effect on next restart
+        # The next health probe picks up the new maximum interval
+        self._health_interval = int(new_settings.get("server_health_check_interval", self._health_interval))
         # Note: auto_start and stop_on_exit are checked at startup/exit
 
     # -----------------------------
@@ -1826,76 +2604,168 @@ class FabricGUI(ctk.CTk):
     # -----------------------------
 
     def view_logs(self) -> None:
-        if LOG_FILE.exists():
-            try:
-                os.startfile(str(LOG_FILE))
-            except Exception:
-                messagebox.showinfo("Logs", str(LOG_FILE))
-        else:
-            messagebox.showinfo("Info", "No log file found.")
+        # Make buffered log records visible before opening the file
+        rotating_handler.flush()
+        # Let startfile report a missing file rather than stat'ing it first
+        try:
+            os.startfile(_LOG_FILE_STR)
+        except FileNotFoundError:
+            self._get_info_dialog().show("Info", "No log file found.")
+        except Exception:
+            self._get_info_dialog().show("Logs", _LOG_FILE_STR)
 
     def show_about(self) -> None:
-        messagebox.showinfo("About", "Fabric GUI v3.2\n\nA desktop client for the Fabric AI framework.\n\nBuilt with Python and CustomTkinter.")
+        self._get_info_dialog().show("About", "Fabric GUI v3.2\n\nA desktop client for the Fabric AI framework.\n\nBuilt with Python and CustomTkinter.")
+
+    def _get_info_dialog(self) -> InfoDialog:
+        if self._info_dialog is None or not self._info_dialog.winfo_exists():
+            self._info_dialog = InfoDialog(self)
+        return self._info_dialog
 
     def show_help(self) -> None:
         """Display the comprehensive help dialog."""
+        # The window is built once and then hidden/shown on later requests
+        if self._help_window is not None and self._help_window.winfo_exists():
+            self._help_window.deiconify()
+            self._help_window.lift()
+            self._help_window.focus_force()
+            self._help_window.grab_set()
+            return
+
         help_window = ctk.CTkToplevel(self)
+        self._help_window = help_window
         help_window.title("Fabric GUI - User Guide")
-        help_window.geometry("700x600")
-        help_window.transient(self)
-        help_window.grab_set()
         
-        # Center the window
-        help_window.update_idletasks()
-        x = self.winfo_x() + (self.winfo_width() // 2) - 350
-        y = self.winfo_y() + (self.winfo_height() // 2) - 300
-        help_window.geometry(f"+{x}+{y}")
+        # Center over the main window with a single placement
+        x = self.winfo_x() + max(0, (self.winfo_width() - 700) // 2)
+        y = self.winfo_y() + max(0, (self.winfo_height() - 600) // 2)
+        help_window.geometry(f"700x600+{x}+{y}")
+        help_window.transient(self)
         
         # Create scrollable text area
         help_text = ctk.CTkTextbox(
             help_window,
+            width=680,
+            height=540,
             wrap="word",
             font=("Consolas", 12),
             fg_color=("gray95", "gray10"),
         )
-        help_text.pack(fill="both", expand=True, padx=10, pady=10)
-        help_text.insert("1.0", HELP_TEXT)
+        # Fill and lock before packing so it is laid out once in its final state
+        help_text.insert("1.0", get_help_text())
         help_text.configure(state="disabled")
+        help_text.pack(fill="both", expand=True, padx=10, pady=10)
         
         # Close button
         close_btn = ctk.CTkButton(
             help_window,
             text="Close",
-            command=help_window.destroy,
+            command=self._hide_help,
             width=100,
         )
         close_btn.pack(pady=(0, 10))
+        help_window.protocol("WM_DELETE_WINDOW", self._hide_help)
+        help_window.bind("<Escape>", lambda _e: self._hide_help())
+        help_window.grab_set()
+
+    def _hide_help(self) -> None:
+        if self._help_window is not None:
+            self._help_window.grab_release()
+            self._help_window.withdraw()
 
     # -----------------------------
     # Closing
     # -----------------------------
 
     def on_closing(self) -> None:
+        if self._shutting_down:
+            return
+        self._shutting_down = True
+
+        # Snapshot the config here on the Tk thread; it is written by the shutdown worker
+        config_snapshot: Optional[Dict[str, Any]] = None
         try:
             self._save_config_from_ui()
+            if self._config_save_after_id:
+                self.after_cancel(self._config_save_after_id)
+                self._config_save_after_id = None
+            if self._config_dirty:
+                self._config_dirty = False
+                config_snapshot = dict(self.app_config)
         except Exception:
             pass
 
-        try:
-            if self.app_config.get("stop_server_on_exit", True):
-                self.server_manager.stop_server()
-        except Exception:
-            pass
+        if self._health_after_id:
+            self.after_cancel(self._health_after_id)
+            self._health_after_id = None
 
-        try:
-            self.server_manager.stop_health_monitoring()
-        except Exception:
-            pass
+        # Stop a running request the same way the Cancel button does, so its
+        # fabric child is terminated before the async loop goes away
+        request = self.current_request
+        if request is not None and not request.done():
+            self.cancel_request = True
+            self._async.call_soon(self._terminate_current_process)
+        else:
+            request = None
+
+        # Hide the window right away; stopping the server can take seconds
+        self.withdraw()
+        stop_server = self.app_config.get("stop_server_on_exit", True)
 
-        logger.info("Fabric GUI closed")
+        def _shutdown_worker() -> None:
+            # Disk writes (with their fsyncs) run after the window is already hidden;
+            # _finish_closing waits for them unless the deadline fires first
+            if request is not None:
+                try:
+                    request.result(timeout=SHUTDOWN_REQUEST_TIMEOUT)
+                except Exception:
+                    pass
+            try:
+                if config_snapshot is not None:
+                    # Queued behind any earlier save, so the final snapshot lands last
+                    self._config_executor.submit(ConfigManager.save, config_snapshot).result()
+            except Exception:
+                pass
+            try:
+                self.history.flush_sync()
+            except Exception:
+                pass
+            try:
+                if stop_server:
+                    self.server_manager.stop_server()
+            except Exception:
+                pass
+            finally:
+                try:
+                    self.after(0, self._finish_closing)
+                except Exception:
+                    # Deadline already fired and the window is gone
+                    pass
+
+        threading.Thread(target=_shutdown_worker, daemon=True).start()
+        self.after(SHUTDOWN_DEADLINE_MS, self._finish_closing)
+
+    def _finish_closing(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+
+        # Drop queued lookups; nothing is left to display their results
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        # Pending config writes are kept; the interpreter finishes them before exiting
+        self._config_executor.shutdown(wait=False)
+        self.server_manager.close()
+        self._async.stop()
+
+        if logger.isEnabledFor(logging.INFO):
+            _log_info("Fabric GUI closed")
         self.destroy()
 
 
-if __name__ == "__main__":
+def main() -> None:
     app = FabricGUI()
     app.mainloop()
+
+
+if __name__ == "__main__":
+    main()
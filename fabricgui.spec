@@ -5,7 +5,7 @@ a = Analysis(
     ['fabricgui.py'],
     pathex=[],
     binaries=[],
-    datas=[],
+    datas=[('help_text.txt', '.')],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},